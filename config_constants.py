@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Configuration Constants for KYC & Sanctions Screening Tool
+Version: 1.0.0
+
+Pure data only: no I/O, no clock reads, no runtime initialisation. Keeping
+this module free of side effects lets its bytecode cache do all the work on
+import. Runtime helpers and lazily computed values live in config.py, which
+re-exports everything defined here.
+"""
+
+import sys
+from dataclasses import dataclass, asdict
+from types import MappingProxyType
+
+# ==================== APPLICATION SETTINGS ====================
+APP_NAME = "KYC & Sanctions Screening Tool"
+APP_VERSION = "1.0.0"
+APP_DESCRIPTION = "Automated Customer Due Diligence and Sanctions Screening"
+DEVELOPER_NAME = "Muhammad Alaa Lotfy Hussein"
+DEVELOPER_EMAIL = "muhammadalaa.rt@gmail.com"
+DEVELOPER_PHONE = "+201034024403"
+
+# ==================== DATABASE CONFIGURATION ====================
+DATABASE_CONFIG = {
+    'engine': 'sqlite',
+    'database': 'kyc_screening.db',
+    'host': 'localhost',
+    'port': None,
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_timeout': 30,
+    'echo': False,
+    'zstd_compression': False,  # Compress long sanctions text columns (needs sqlite-zstd)
+}
+
+# Applied in order to every connection KYCDatabase opens
+SQLITE_PRAGMAS = (
+    ('page_size', 8192),          # Only takes effect before the first table is created
+    ('journal_mode', 'WAL'),      # Readers never block the writer (and vice versa)
+    ('synchronous', 'NORMAL'),    # Crash-safe under WAL; skips the second fsync per commit
+    ('busy_timeout', 5000),       # Milliseconds to wait on a lock before SQLITE_BUSY
+    ('cache_size', -64000),       # Negative means KiB: ~64 MB page cache
+    ('temp_store', 'MEMORY'),     # Sorts and GROUP BY temp tables stay in RAM
+    ('mmap_size', 268435456),     # 256 MB of memory-mapped reads
+    ('foreign_keys', 'ON'),
+)
+
+# ==================== SCREENING CONFIGURATION ====================
+@dataclass(frozen=True)
+class ScreeningConfig:
+    """Screening settings with plain attribute access (see SCREENING)"""
+    # Declared by hand rather than via dataclass(slots=True) to stay
+    # compatible with Python 3.8; this is why the fields have no defaults.
+    __slots__ = (
+        'name_match_threshold', 'dob_match_threshold', 'id_match_threshold',
+        'fuzzy_match_enabled', 'partial_match_weight', 'exact_match_weight',
+        'auto_generate_reports', 'default_screening_type',
+    )
+    
+    name_match_threshold: int
+    dob_match_threshold: int
+    id_match_threshold: int
+    fuzzy_match_enabled: bool
+    partial_match_weight: float
+    exact_match_weight: float
+    auto_generate_reports: bool
+    default_screening_type: str
+
+SCREENING = ScreeningConfig(
+    name_match_threshold=85,      # Minimum similarity score for name matching
+    dob_match_threshold=90,       # Minimum similarity score for date of birth matching
+    id_match_threshold=95,        # Minimum similarity score for ID matching
+    fuzzy_match_enabled=True,     # Enable fuzzy matching algorithms
+    partial_match_weight=0.7,     # Weight for partial matches in risk scoring
+    exact_match_weight=1.0,       # Weight for exact matches in risk scoring
+    auto_generate_reports=True,   # Automatically generate screening reports
+    default_screening_type='ONBOARDING',  # Default screening type
+)
+
+# Read-only dict view of SCREENING, kept for existing callers and JSON export
+SCREENING_CONFIG = MappingProxyType(asdict(SCREENING))
+
+# Hot-path scalars, hoisted so tight loops avoid a dict subscript.
+# Match thresholds are on the 0-100 scale used by StringUtils and by
+# RapidFuzz, so they can be passed straight through as `score_cutoff`
+# (letting RapidFuzz abandon a comparison early) without rescaling.
+NAME_MATCH_THRESHOLD = SCREENING.name_match_threshold
+DOB_MATCH_THRESHOLD = SCREENING.dob_match_threshold
+ID_MATCH_THRESHOLD = SCREENING.id_match_threshold
+
+# The same thresholds on the 0-1 scale, for comparing against normalised
+# similarity ratios (e.g. SequenceMatcher.ratio()) without a runtime divide
+NAME_MATCH_THRESHOLD_F = NAME_MATCH_THRESHOLD / 100.0
+DOB_MATCH_THRESHOLD_F = DOB_MATCH_THRESHOLD / 100.0
+ID_MATCH_THRESHOLD_F = ID_MATCH_THRESHOLD / 100.0
+
+# ==================== RISK ASSESSMENT CONFIGURATION ====================
+RISK_SCORING = MappingProxyType({
+    'pep_penalty': 30,               # Risk score penalty for PEP identification
+    'high_risk_country_penalty': 25, # Risk score penalty for high-risk countries
+    'sanction_match_penalty': 100,   # Risk score penalty for sanction matches
+    'partial_match_penalty': 50,     # Risk score penalty for partial matches
+    'age_risk_threshold': 70,        # Age threshold for additional risk (years)
+    'unusual_id_penalty': 20,        # Penalty for unusual ID patterns
+    'max_risk_score': 100,           # Maximum possible risk score
+})
+
+SANCTION_MATCH_PENALTY = RISK_SCORING['sanction_match_penalty']
+PARTIAL_MATCH_PENALTY = RISK_SCORING['partial_match_penalty']
+MAX_RISK_SCORE = RISK_SCORING['max_risk_score']
+
+# ==================== HIGH-RISK COUNTRIES ====================
+_HIGH_RISK_CODES = (
+    'AF',  # Afghanistan
+    'IR',  # Iran
+    'KP',  # North Korea
+    'SY',  # Syria
+    'YE',  # Yemen
+    'SD',  # Sudan
+    'SO',  # Somalia
+    'IQ',  # Iraq
+    'LY',  # Libya
+    'VE',  # Venezuela
+    'CU',  # Cuba
+    'RU',  # Russia
+    'BY',  # Belarus
+    'MM',  # Myanmar
+    'ER',  # Eritrea
+    'ZW',  # Zimbabwe
+)
+
+_MEDIUM_RISK_CODES = (
+    'PK',  # Pakistan
+    'NG',  # Nigeria
+    'ET',  # Ethiopia
+    'CD',  # DR Congo
+    'TZ',  # Tanzania
+    'KE',  # Kenya
+    'UG',  # Uganda
+    'GH',  # Ghana
+    'CI',  # Ivory Coast
+    'CM',  # Cameroon
+)
+
+# Interned explicitly so a lookup with an interned code hits the identity
+# fast path instead of comparing string contents. Codes read from user
+# input, CSV, JSON or the database are fresh string objects, so ingest code
+# should pass them through sys.intern() too.
+_HIGH_RISK_CODES = tuple(map(sys.intern, _HIGH_RISK_CODES))
+_MEDIUM_RISK_CODES = tuple(map(sys.intern, _MEDIUM_RISK_CODES))
+
+# Country code -> risk tier (2 = high, 1 = medium); unlisted codes are tier 0.
+# One .get() classifies a country instead of a membership test per list.
+COUNTRY_RISK_TIER = MappingProxyType({
+    **dict.fromkeys(_MEDIUM_RISK_CODES, 1),
+    **dict.fromkeys(_HIGH_RISK_CODES, 2),
+})
+
+# Risk score penalty per tier, indexed by COUNTRY_RISK_TIER values
+COUNTRY_TIER_PENALTY = (0, 0, RISK_SCORING['high_risk_country_penalty'])
+
+HIGH_RISK_COUNTRIES = frozenset(_HIGH_RISK_CODES)
+MEDIUM_RISK_COUNTRIES = frozenset(_MEDIUM_RISK_CODES)
+
+# ==================== PEP (POLITICALLY EXPOSED PERSONS) INDICATORS ====================
+# Stored lowercase: callers lowercase the text being searched, never the indicators
+_PEP_INDICATOR_WORDS = (
+    # Political Positions
+    'minister', 'president', 'prime minister', 'senator', 'congress', 'parliament',
+    'ambassador', 'governor', 'mayor', 'diplomat', 'secretary', 'commissioner',
+    
+    # Military Ranks
+    'general', 'colonel', 'major', 'captain', 'admiral', 'marshal',
+    
+    # Royalty and Nobility
+    'king', 'queen', 'prince', 'princess', 'emir', 'sultan', 'sheikh', 'royal',
+    
+    # Judiciary
+    'judge', 'justice', 'magistrate', 'prosecutor',
+    
+    # Government Agencies
+    'director', 'controller', 'auditor',
+)
+
+PEP_INDICATORS = frozenset(_PEP_INDICATOR_WORDS)
+
+# Longest first, for callers that scan the indicators in order
+PEP_INDICATORS_BY_LEN = tuple(sorted(PEP_INDICATORS, key=lambda word: (-len(word), word)))
+
+# ==================== SANCTIONS LIST SOURCES ====================
+SANCTIONS_SOURCES = {
+    'OFAC': 'Office of Foreign Assets Control (US Treasury)',
+    'UN': 'United Nations Security Council',
+    'EU': 'European Union Consolidated List',
+    'UK': 'UK Office of Financial Sanctions Implementation',
+    'AU': 'Australian Department of Foreign Affairs and Trade',
+    'CA': 'Canadian Office of the Superintendent of Financial Institutions',
+}
+
+# ==================== FILE PATHS AND DIRECTORIES ====================
+FILE_PATHS = {
+    'database': 'kyc_screening.db',
+    'logs': 'logs/',
+    'exports': 'exports/',
+    'reports': 'reports/',
+    'templates': 'templates/',
+    'backups': 'backups/',
+}
+
+# ==================== LOGGING CONFIGURATION ====================
+# Ready for logging.config.dictConfig(); no translation step needed at startup
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+        },
+    },
+    'handlers': {
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': 'kyc_screening.log',
+            'maxBytes': 10 * 1024 * 1024,  # Maximum log file size (10 MB)
+            'backupCount': 5,  # Number of backup log files to keep
+            'encoding': 'utf-8',
+            'formatter': 'standard',
+        },
+        'console': {
+            'class': 'logging.StreamHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'standard',
+        },
+    },
+    'root': {
+        'level': 'INFO',  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+        'handlers': ['file', 'console'],
+    },
+}
+
+# ==================== REPORT CONFIGURATION ====================
+REPORT_CONFIG = {
+    'company_name': 'AML Compliance Solutions',
+    'company_logo': None,  # Path to logo image (optional)
+    'report_footer': 'Confidential - For Internal Use Only',
+    'date_format': '%d/%m/%Y %H:%M:%S',
+    'timezone': 'Africa/Cairo',
+    'default_language': 'en',  # en, ar
+    'include_executive_summary': True,
+    'include_recommendations': True,
+}
+
+# ==================== VALIDATION RULES ====================
+VALIDATION_RULES = MappingProxyType({
+    'min_name_length': 2,
+    'max_name_length': 100,
+    'min_id_length': 4,
+    'max_id_length': 50,
+    'allowed_id_types': ['PASSPORT', 'NATIONAL_ID', 'DRIVERS_LICENSE', 'RESIDENCE_PERMIT'],
+    'allowed_genders': ['M', 'F', 'O'],  # Male, Female, Other
+    'allowed_customer_types': ['INDIVIDUAL', 'CORPORATE', 'PARTNERSHIP', 'TRUST'],
+})
@@ -5,21 +5,208 @@ Version: 1.0.0
 """
 
 import sqlite3
-import pandas as pd
+import csv
 import json
+import functools
+import hashlib
+import itertools
+import operator
+import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from pathlib import Path
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 import config
+from utils import StringUtils
+
+try:
+    import sqlite_zstd
+except ImportError:
+    sqlite_zstd = None
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.LOGGING_CONFIG['level']),
-    format=config.LOGGING_CONFIG['format'],
-    datefmt=config.LOGGING_CONFIG['date_format']
-)
 logger = logging.getLogger(__name__)
 
+# Sanctions columns held in memory by load_sanctions_matrix for scoring
+_SANCTIONS_MATRIX_COLUMNS = (
+    'id', 'full_name_en', 'full_name_ar', 'full_name_en_norm', 'full_name_ar_norm',
+    'alias_en', 'alias_ar', 'nationality_code', 'date_of_birth',
+    'list_source', 'risk_level',
+)
+
+# Columns returned by get_customer and search_sanctions: what screening,
+# display and reporting read, rather than SELECT *
+_CUSTOMER_VIEW_COLUMNS = (
+    'id', 'customer_code', 'full_name_en', 'full_name_ar', 'date_of_birth',
+    'nationality_code', 'id_type', 'id_number', 'occupation', 'customer_type',
+    'risk_category', 'pep_flag', 'kyc_status',
+)
+_SANCTION_VIEW_COLUMNS = (
+    'id', 'list_source', 'list_type', 'reference_id', 'full_name_en', 'full_name_ar',
+    'alias_en', 'alias_ar', 'nationality_code', 'nationality_name', 'date_of_birth',
+    'designation', 'risk_level', 'full_name_en_norm', 'full_name_ar_norm',
+)
+
+# Reference tables created by initialize_database and the codes each holds
+_REFERENCE_CODES = {
+    'risk_levels': ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'),
+    'list_sources': ('OFAC', 'UN', 'EU', 'UK', 'AU', 'CA', 'OTHER'),
+    'screening_outcomes': ('CLEAR', 'CLEAR_WITH_WARNING', 'REVIEW_REQUIRED', 'REJECTED', 'PENDING'),
+    'match_types': ('EXACT', 'PARTIAL', 'FUZZY', 'NO_MATCH'),
+}
+
+# Free-text sanctions columns compressed in place when
+# DATABASE_CONFIG['zstd_compression'] is on. Names and codes stay plain
+# so the FTS index, LIKE fallback and matrix loads never decompress.
+_ZSTD_COLUMNS = ('designation', 'reason')
+
+# Prepared statements kept per connection by the sqlite3 module
+_STATEMENT_CACHE_SIZE = 256
+
+# Every insertable customers column, in table order. add_customer always
+# binds all of them so the INSERT text never changes and its compiled
+# statement is reused from the cache on every call.
+_CUSTOMER_COLUMNS = (
+    'customer_code', 'full_name_ar', 'full_name_en', 'date_of_birth',
+    'nationality_code', 'nationality_name', 'id_type', 'id_number',
+    'id_issue_date', 'id_expiry_date', 'gender', 'occupation',
+    'customer_type', 'risk_category', 'pep_flag', 'kyc_status', 'notes',
+)
+
+# Column DEFAULTs from the schema, applied in Python because binding NULL
+# explicitly would bypass them
+_CUSTOMER_DEFAULTS = {
+    'customer_type': 'INDIVIDUAL',
+    'risk_category': 'LOW',
+    'pep_flag': 0,
+    'kyc_status': 'PENDING',
+}
+
+# Column order of sanctions rows accepted by load_sample_sanctions and
+# bulk_load_sanctions
+_SANCTION_COLUMNS = (
+    'list_source', 'list_type', 'reference_id', 'full_name_ar', 'full_name_en',
+    'alias_ar', 'alias_en', 'nationality_code', 'nationality_name', 'date_of_birth',
+    'place_of_birth', 'id_type', 'id_number', 'designation', 'reason',
+    'effective_date', 'expiry_date', 'un_resolution', 'eu_regulation', 'ofac_id', 'risk_level',
+)
+
+# Normalised copies of the sanction names (StringUtils.normalize_english /
+# normalize_arabic), computed once at insert time so matching and search
+# never re-normalise a stored name. Appended to rows by _sanction_rows.
+_SANCTION_NORM_COLUMNS = ('full_name_en_norm', 'full_name_ar_norm')
+_NAME_EN_INDEX = _SANCTION_COLUMNS.index('full_name_en')
+_NAME_AR_INDEX = _SANCTION_COLUMNS.index('full_name_ar')
+
+_INSERT_SANCTION_SQL = (
+    f"INSERT INTO sanctions ({', '.join(_SANCTION_COLUMNS + _SANCTION_NORM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(_SANCTION_COLUMNS) + len(_SANCTION_NORM_COLUMNS)))})"
+)
+
+_INSERT_CUSTOMER_SQL = (
+    f"INSERT INTO customers ({', '.join(_CUSTOMER_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_CUSTOMER_COLUMNS))})"
+)
+
+# Demonstration rows inserted by load_sample_sanctions, in _SANCTION_COLUMNS order
+_SAMPLE_SANCTIONS = (
+    # OFAC SDN List entries
+    ('OFAC', 'INDIVIDUAL', 'SDN12345', 'أحمد علي المصري', 'Ahmed Ali Al-Masri',
+     'أحمد المصري', 'Ahmed Al-Masri', 'EG', 'Egypt', '1980-05-15', 'Cairo',
+     'PASSPORT', 'A12345678', 'Terrorism Financing', 'Involved in terrorism financing activities',
+     '2020-01-15', None, None, None, 'SDN12345', 'HIGH'),
+    
+    ('OFAC', 'INDIVIDUAL', 'SDN12346', 'محمد حسن', 'Mohamed Hassan',
+     '', '', 'SY', 'Syria', '1975-11-22', 'Damascus',
+     'PASSPORT', 'S78901234', 'Supporting Regime', 'Supporting human rights violations',
+     '2019-03-10', None, None, None, 'SDN12346', 'HIGH'),
+    
+    # UN Sanctions List entries
+    ('UN', 'INDIVIDUAL', 'UN12345', 'إيفان بتروف', 'Ivan Petrov',
+     'إيفان الروسي', 'Ivan the Russian', 'RU', 'Russia', '1970-08-30', 'Moscow',
+     'PASSPORT', 'R34567890', 'Arms Trafficking', 'Illegal arms trade',
+     '2021-06-20', None, 'UNSCR 2374', None, None, 'HIGH'),
+    
+    # EU Consolidated List entries
+    ('EU', 'ENTITY', 'EU12345', 'مجموعة الإرهاب أ', 'Terror Group A',
+     'تنظيم أ', 'Group A', 'SY', 'Syria', None, None,
+     None, None, 'Terrorist Organization', 'Terrorism activities',
+     '2018-09-05', None, None, 'EU Regulation 2020/123', None, 'HIGH'),
+    
+    ('EU', 'INDIVIDUAL', 'EU12346', 'خوان كارلوس', 'Juan Carlos',
+     '', '', 'MX', 'Mexico', '1965-04-12', 'Mexico City',
+     'PASSPORT', 'M56789012', 'Drug Trafficking', 'Narcotics distribution network',
+     '2022-02-28', None, None, 'EU Regulation 2021/456', None, 'HIGH'),
+)
+
+# Recorded in the meta table once the sample rows are in place, so later
+# startups can skip load_sample_sanctions without taking the write lock
+_SAMPLE_SANCTIONS_DIGEST = hashlib.blake2b(repr(_SAMPLE_SANCTIONS).encode('utf-8'),
+                                           digest_size=16).hexdigest()
+
+# Tables export_to_csv may read; the name is interpolated into the SQL
+_EXPORTABLE_TABLES = frozenset({
+    'customers', 'addresses', 'contacts', 'sanctions',
+    'screening_results', 'sanction_matches', 'audit_log',
+})
+
+# Buffer for CSV imports and exports: large sequential I/O, fewer syscalls
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+# Most audit rows written per transaction by the background audit writer
+_AUDIT_BATCH_SIZE = 500
+
+def _validate_customer_fields(customer_data: Dict[str, Any]) -> Optional[str]:
+    """Return why a customer record cannot be inserted, or None if it can"""
+    required_fields = ['customer_code', 'full_name_en', 'nationality_code', 'id_number']
+    for field in required_fields:
+        if field not in customer_data or not customer_data[field]:
+            return f"Missing required field: {field}"
+    
+    unknown = customer_data.keys() - set(_CUSTOMER_COLUMNS)
+    if unknown:
+        return f"Unknown customer field(s): {', '.join(sorted(unknown))}"
+    return None
+
+def _customer_row(customer_data: Dict[str, Any]) -> tuple:
+    """Customer values in _CUSTOMER_COLUMNS order, with missing or None fields defaulted"""
+    row = []
+    for column in _CUSTOMER_COLUMNS:
+        value = customer_data.get(column)
+        row.append(_CUSTOMER_DEFAULTS.get(column) if value is None else value)
+    return tuple(row)
+
+def _sanction_rows(rows) -> List[tuple]:
+    """Rows in _SANCTION_COLUMNS order with their _SANCTION_NORM_COLUMNS values appended"""
+    names_en = StringUtils.normalize_english_batch([row[_NAME_EN_INDEX] for row in rows])
+    names_ar = StringUtils.normalize_arabic_batch([row[_NAME_AR_INDEX] for row in rows])
+    return [(*row, name_en, name_ar) for row, name_en, name_ar in zip(rows, names_en, names_ar)]
+
+def _search_key(text: str) -> str:
+    """Normalise a search term the way the stored *_norm name columns are"""
+    return StringUtils.normalize_english(StringUtils.normalize_arabic(text))
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """
+    Fetch the remaining rows of an executed cursor as dictionaries
+    
+    Connections return plain tuples; the column names are read from the
+    cursor description once per result set instead of once per row.
+    """
+    columns = tuple(column[0] for column in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor]
+
+def _writer(method):
+    """Run a KYCDatabase method while holding its write lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class KYCDatabase:
     """
     Database management class for KYC Screening Tool
@@ -40,10 +227,29 @@ class KYCDatabase:
             db_path (str): Path to the SQLite database file
         """
         self.db_path = db_path or config.DATABASE_CONFIG['database']
-        self.conn = None
+        self.conn = None  # Single writer connection
         self.cursor = None
         self.connected = False
+        self.fts_enabled = False  # Set by initialize_database
+        self.sanctions_matrix = None  # Set by load_sanctions_matrix
+        self.sanctions_version = 0  # Bumped whenever sanctions rows are loaded
+        
+        # Reentrant because _log_audit_action writes inside other writes
+        self._write_lock = threading.RLock()
         
+        # Read-only connections, opened on demand up to one per CPU. WAL lets
+        # them read concurrently with each other and with the writer.
+        self._readers = None
+        self._reader_uri = None
+        self._reader_count = 0
+        self._reader_limit = os.cpu_count() or 4
+        self._pool_lock = threading.Lock()
+        
+        # Audit entries are queued and written in batches by a background
+        # thread, off the path of the operation being audited
+        self._audit_queue = None
+        self._audit_thread = None
+    
     def connect(self) -> bool:
         """
         Establish connection to the database
@@ -52,11 +258,25 @@ class KYCDatabase:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row  # Enable dictionary-like access
+            # Autocommit mode: write paths open their own BEGIN IMMEDIATE
+            # transactions instead of relying on implicit deferred ones
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                        isolation_level=None,
+                                        cached_statements=_STATEMENT_CACHE_SIZE)
             self.cursor = self.conn.cursor()
-            self.conn.execute("PRAGMA foreign_keys = ON")
-            self.conn.execute("PRAGMA journal_mode = WAL")
+            self._apply_pragmas(self.conn)
+            self._load_extensions(self.conn)
+            
+            # An in-memory database exists only inside its own connection,
+            # so reads there go through the writer instead of a pool
+            if self.db_path != ':memory:' and not self.db_path.startswith('file:'):
+                self._reader_uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+                self._readers = queue.Queue()
+            
+            self._audit_queue = queue.Queue()
+            self._audit_thread = threading.Thread(target=self._audit_writer,
+                                                  name='kyc-audit-writer', daemon=True)
+            self._audit_thread.start()
             
             self.connected = True
             logger.info(f"✅ Successfully connected to database: {self.db_path}")
@@ -67,13 +287,141 @@ class KYCDatabase:
             self.connected = False
             return False
     
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply config.SQLITE_PRAGMAS to a connection
+        
+        SQLite silently keeps its old journal mode when WAL is unavailable
+        (in-memory databases, some network filesystems), so the mode it
+        reports back is checked and logged.
+        
+        Args:
+            conn (sqlite3.Connection): Freshly opened connection
+        """
+        for name, value in config.SQLITE_PRAGMAS:
+            row = conn.execute(f"PRAGMA {name} = {value}").fetchone()
+            if name == 'journal_mode' and str(row[0]).upper() != str(value).upper():
+                logger.warning(f"⚠️  journal_mode is {row[0]!r}, not {value!r}: {self.db_path}")
+    
+    def _load_extensions(self, conn: sqlite3.Connection) -> None:
+        """
+        Load sqlite-zstd into a connection when compression is enabled
+        
+        Every connection needs the extension once the columns are compressed,
+        since reading them goes through its decompression functions.
+        
+        Args:
+            conn (sqlite3.Connection): Freshly opened connection
+        """
+        if not config.DATABASE_CONFIG.get('zstd_compression'):
+            return
+        if sqlite_zstd is None:
+            logger.warning("⚠️  zstd_compression is enabled but sqlite-zstd is not installed")
+            return
+        conn.enable_load_extension(True)
+        try:
+            sqlite_zstd.load(conn)
+        finally:
+            conn.enable_load_extension(False)
+    
+    def _enable_zstd_compression(self) -> None:
+        """Turn on transparent zstd compression for the sanctions text columns (once)"""
+        if not config.DATABASE_CONFIG.get('zstd_compression') or sqlite_zstd is None:
+            return
+        # sqlite-zstd moves the table to _sanctions_zstd behind a view
+        if self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = '_sanctions_zstd'").fetchone():
+            return
+        for column in _ZSTD_COLUMNS:
+            self.cursor.execute("SELECT zstd_enable_transparent(?)", (json.dumps({
+                'table': 'sanctions', 'column': column,
+                'compression_level': 19, 'dict_chooser': "'a'",
+            }),))
+        self.cursor.execute("SELECT zstd_incremental_maintenance(NULL, 1)")
+        logger.info("✅ zstd compression enabled for sanctions text columns")
+    
+    def _open_reader(self) -> Optional[sqlite3.Connection]:
+        """Open another read-only connection, or return None if the pool is full"""
+        with self._pool_lock:
+            if self._reader_count >= self._reader_limit:
+                return None
+            self._reader_count += 1
+        try:
+            conn = sqlite3.connect(self._reader_uri, uri=True, check_same_thread=False,
+                                   cached_statements=_STATEMENT_CACHE_SIZE)
+            self._apply_pragmas(conn)
+            self._load_extensions(conn)
+            return conn
+        except sqlite3.Error:
+            with self._pool_lock:
+                self._reader_count -= 1
+            raise
+    
+    @contextmanager
+    def read_conn(self):
+        """
+        Borrow a read-only connection from the pool
+        
+        Yields:
+            sqlite3.Connection: Connection to run SELECT statements on
+        """
+        if self._readers is None:
+            with self.write_conn() as conn:
+                yield conn
+            return
+        
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader() or self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    @contextmanager
+    def write_conn(self):
+        """
+        Hold the write lock and yield the single writer connection
+        
+        Yields:
+            sqlite3.Connection: The writer connection
+        """
+        with self._write_lock:
+            yield self.conn
+    
+    def close_idle_readers(self) -> None:
+        """
+        Close every pooled reader not currently borrowed
+        
+        Readers are reopened on demand, so this can be called whenever the
+        database is about to sit idle (e.g. while waiting on user input) to
+        give back their file handles and page caches.
+        """
+        if self._readers is None:
+            return
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._reader_count -= 1
+    
     def disconnect(self) -> None:
         """Close the database connection"""
+        if self._audit_thread is not None:
+            self._audit_queue.put(None)  # Flush what is queued, then stop
+            self._audit_thread.join()
+            self._audit_thread = None
+            self._audit_queue = None
+        self.close_idle_readers()
+        self._readers = None
         if self.conn:
             self.conn.close()
             self.connected = False
             logger.info("✅ Database connection closed")
     
+    @_writer
     def initialize_database(self) -> bool:
         """
         Initialize database with all required tables
@@ -86,6 +434,19 @@ class KYCDatabase:
             return False
         
         try:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            
+            # ========== REFERENCE TABLES ==========
+            # Allowed codes for enumerated columns, enforced through foreign keys
+            for table, codes in _REFERENCE_CODES.items():
+                self.cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        code VARCHAR(20) PRIMARY KEY
+                    ) WITHOUT ROWID
+                ''')
+                self.cursor.executemany(f"INSERT OR IGNORE INTO {table} (code) VALUES (?)",
+                                        [(code,) for code in codes])
+            
             # ========== CUSTOMERS TABLE ==========
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS customers (
@@ -110,8 +471,8 @@ class KYCDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     
+                    FOREIGN KEY (risk_category) REFERENCES risk_levels(code),
                     CHECK (gender IN ('M', 'F', 'O')),
-                    CHECK (risk_category IN ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
                     CHECK (kyc_status IN ('PENDING', 'IN_PROGRESS', 'COMPLETED', 'REJECTED', 'ON_HOLD'))
                 )
             ''')
@@ -176,12 +537,15 @@ class KYCDatabase:
                     risk_level VARCHAR(20) DEFAULT 'HIGH',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    full_name_en_norm TEXT,
+                    full_name_ar_norm TEXT,
                     
-                    CHECK (list_source IN ('OFAC', 'UN', 'EU', 'UK', 'AU', 'CA', 'OTHER')),
-                    CHECK (list_type IN ('INDIVIDUAL', 'ENTITY', 'VESSEL', 'AIRCRAFT')),
-                    CHECK (risk_level IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL'))
+                    FOREIGN KEY (list_source) REFERENCES list_sources(code),
+                    FOREIGN KEY (risk_level) REFERENCES risk_levels(code),
+                    CHECK (list_type IN ('INDIVIDUAL', 'ENTITY', 'VESSEL', 'AIRCRAFT'))
                 )
             ''')
+            self._add_sanction_norm_columns()
             
             # ========== SCREENING RESULTS TABLE ==========
             self.cursor.execute('''
@@ -204,9 +568,9 @@ class KYCDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     
                     FOREIGN KEY (customer_code) REFERENCES customers(customer_code) ON DELETE CASCADE,
-                    CHECK (screening_type IN ('ONBOARDING', 'PERIODIC', 'AD_HOC', 'BATCH')),
-                    CHECK (risk_level IN ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
-                    CHECK (screening_result IN ('CLEAR', 'CLEAR_WITH_WARNING', 'REVIEW_REQUIRED', 'REJECTED', 'PENDING'))
+                    FOREIGN KEY (risk_level) REFERENCES risk_levels(code),
+                    FOREIGN KEY (screening_result) REFERENCES screening_outcomes(code),
+                    CHECK (screening_type IN ('ONBOARDING', 'PERIODIC', 'AD_HOC', 'BATCH'))
                 )
             ''')
             
@@ -231,11 +595,20 @@ class KYCDatabase:
                     
                     FOREIGN KEY (screening_id) REFERENCES screening_results(screening_id) ON DELETE CASCADE,
                     FOREIGN KEY (sanction_id) REFERENCES sanctions(id) ON DELETE CASCADE,
-                    CHECK (match_type IN ('EXACT', 'PARTIAL', 'FUZZY', 'NO_MATCH')),
-                    CHECK (risk_level IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL'))
+                    FOREIGN KEY (match_type) REFERENCES match_types(code),
+                    FOREIGN KEY (risk_level) REFERENCES risk_levels(code)
                 )
             ''')
             
+            # ========== META TABLE ==========
+            # Key/value markers the application keeps about the database itself
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS meta (
+                    key VARCHAR(50) PRIMARY KEY,
+                    value TEXT
+                ) WITHOUT ROWID
+            ''')
+            
             # ========== AUDIT LOG TABLE ==========
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS audit_log (
@@ -251,7 +624,33 @@ class KYCDatabase:
                 )
             ''')
             
+            # ========== INDEXES ==========
+            # Grouping and filter columns used by get_statistics
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_customers_risk ON customers(risk_category)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_customers_created ON customers(created_at)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_sanctions_source ON sanctions(list_source)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_screening_result ON screening_results(screening_result)")
+            
+            # Sanctions by nationality, for country-level review and filtering
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_sanctions_nationality ON sanctions(nationality_code)")
+            
+            # A customer's screening history, newest last; also serves the
+            # ON DELETE CASCADE lookup from customers
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_screening_customer_date "
+                "ON screening_results(customer_code, screening_date)"
+            )
+            
+            # Child side of the sanction_matches foreign keys, so deleting a
+            # screening or a sanction does not scan every match
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_screening ON sanction_matches(screening_id)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_sanction ON sanction_matches(sanction_id)")
+            
+            # ========== SANCTIONS FULL-TEXT INDEX ==========
+            self.fts_enabled = self._create_sanctions_fts()
+            
             self.conn.commit()
+            self._enable_zstd_compression()
             logger.info("✅ Database tables created successfully")
             return True
             
@@ -260,10 +659,108 @@ class KYCDatabase:
             self.conn.rollback()
             return False
     
+    def _add_sanction_norm_columns(self) -> None:
+        """
+        Add and backfill the normalised name columns on a sanctions table created without them
+        
+        Runs inside initialize_database's transaction.
+        """
+        self.cursor.execute("PRAGMA table_info(sanctions)")
+        existing = {row[1] for row in self.cursor.fetchall()}
+        missing = [column for column in _SANCTION_NORM_COLUMNS if column not in existing]
+        if not missing:
+            return
+        
+        for column in missing:
+            self.cursor.execute(f"ALTER TABLE sanctions ADD COLUMN {column} TEXT")
+        self.cursor.execute("SELECT id, full_name_en, full_name_ar FROM sanctions")
+        rows = self.cursor.fetchall()
+        if rows:
+            ids, names_en, names_ar = zip(*rows)
+            self.cursor.executemany(
+                "UPDATE sanctions SET full_name_en_norm = ?, full_name_ar_norm = ? WHERE id = ?",
+                zip(StringUtils.normalize_english_batch(names_en),
+                    StringUtils.normalize_arabic_batch(names_ar), ids)
+            )
+        logger.info(f"✅ Added normalised name columns to sanctions: {', '.join(missing)}")
+    
+    def _create_sanctions_fts(self) -> bool:
+        """
+        Create the FTS5 index over sanction names and the triggers that keep it in sync
+        
+        Names are indexed through their *_norm columns. Runs inside
+        initialize_database's transaction. SQLite builds without FTS5 are
+        detected here and search_sanctions falls back to LIKE.
+        
+        Returns:
+            bool: True if the full-text index is available
+        """
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sanctions_fts'"
+        )
+        existed = self.cursor.fetchone() is not None
+        
+        # An index built over the raw name columns is replaced, then rebuilt below
+        if existed:
+            self.cursor.execute("PRAGMA table_info(sanctions_fts)")
+            if 'full_name_en_norm' not in {row[1] for row in self.cursor.fetchall()}:
+                for trigger in ('sanctions_fts_ai', 'sanctions_fts_ad', 'sanctions_fts_au'):
+                    self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                self.cursor.execute("DROP TABLE sanctions_fts")
+                existed = False
+        
+        try:
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS sanctions_fts USING fts5(
+                    full_name_en_norm, full_name_ar_norm, alias_en, alias_ar,
+                    content='sanctions', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️  FTS5 unavailable, sanctions search will use LIKE: {e}")
+            return False
+        
+        # Executed one by one: executescript() would commit the enclosing transaction
+        triggers = (
+            '''
+            CREATE TRIGGER IF NOT EXISTS sanctions_fts_ai AFTER INSERT ON sanctions BEGIN
+                INSERT INTO sanctions_fts (rowid, full_name_en_norm, full_name_ar_norm, alias_en, alias_ar)
+                VALUES (new.id, new.full_name_en_norm, new.full_name_ar_norm, new.alias_en, new.alias_ar);
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS sanctions_fts_ad AFTER DELETE ON sanctions BEGIN
+                INSERT INTO sanctions_fts (sanctions_fts, rowid, full_name_en_norm, full_name_ar_norm, alias_en, alias_ar)
+                VALUES ('delete', old.id, old.full_name_en_norm, old.full_name_ar_norm, old.alias_en, old.alias_ar);
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS sanctions_fts_au AFTER UPDATE ON sanctions BEGIN
+                INSERT INTO sanctions_fts (sanctions_fts, rowid, full_name_en_norm, full_name_ar_norm, alias_en, alias_ar)
+                VALUES ('delete', old.id, old.full_name_en_norm, old.full_name_ar_norm, old.alias_en, old.alias_ar);
+                INSERT INTO sanctions_fts (rowid, full_name_en_norm, full_name_ar_norm, alias_en, alias_ar)
+                VALUES (new.id, new.full_name_en_norm, new.full_name_ar_norm, new.alias_en, new.alias_ar);
+            END
+            ''',
+        )
+        for trigger in triggers:
+            self.cursor.execute(trigger)
+        
+        # Index rows that were loaded before the FTS table existed
+        if not existed:
+            self.cursor.execute("INSERT INTO sanctions_fts (sanctions_fts) VALUES ('rebuild')")
+        return True
+    
+    @_writer
     def load_sample_sanctions(self) -> bool:
         """
         Load sample sanctions data for demonstration purposes
         
+        Skipped without a write transaction when the meta table shows this
+        version of the sample rows has already been handled. Rows are only
+        inserted into an empty sanctions table.
+        
         Returns:
             bool: True if data loaded successfully, False otherwise
         """
@@ -272,57 +769,37 @@ class KYCDatabase:
             return False
         
         try:
+            self.cursor.execute("SELECT value FROM meta WHERE key = 'sample_sanctions_hash'")
+            row = self.cursor.fetchone()
+            if row is not None and row[0] == _SAMPLE_SANCTIONS_DIGEST:
+                logger.info("✅ Sample sanctions already loaded")
+                return True
+            
+            # Take the write lock before the check so two loaders cannot both
+            # see an empty table
+            self.cursor.execute("BEGIN IMMEDIATE")
+            
             # Check if sanctions table already has data
             self.cursor.execute("SELECT COUNT(*) FROM sanctions")
             count = self.cursor.fetchone()[0]
             
+            if count == 0:
+                self.cursor.executemany(_INSERT_SANCTION_SQL, _sanction_rows(_SAMPLE_SANCTIONS))
+            self.cursor.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('sample_sanctions_hash', ?)",
+                (_SAMPLE_SANCTIONS_DIGEST,)
+            )
+            self.conn.commit()
+            
             if count > 0:
                 logger.info(f"✅ Sanctions table already contains {count} records")
                 return True
             
-            # Sample sanctions data
-            sample_sanctions = [
-                # OFAC SDN List entries
-                ('OFAC', 'INDIVIDUAL', 'SDN12345', 'أحمد علي المصري', 'Ahmed Ali Al-Masri',
-                 'أحمد المصري', 'Ahmed Al-Masri', 'EG', 'Egypt', '1980-05-15', 'Cairo',
-                 'PASSPORT', 'A12345678', 'Terrorism Financing', 'Involved in terrorism financing activities',
-                 '2020-01-15', None, None, None, 'SDN12345', 'HIGH'),
-                
-                ('OFAC', 'INDIVIDUAL', 'SDN12346', 'محمد حسن', 'Mohamed Hassan',
-                 '', '', 'SY', 'Syria', '1975-11-22', 'Damascus',
-                 'PASSPORT', 'S78901234', 'Supporting Regime', 'Supporting human rights violations',
-                 '2019-03-10', None, None, None, 'SDN12346', 'HIGH'),
-                
-                # UN Sanctions List entries
-                ('UN', 'INDIVIDUAL', 'UN12345', 'إيفان بتروف', 'Ivan Petrov',
-                 'إيفان الروسي', 'Ivan the Russian', 'RU', 'Russia', '1970-08-30', 'Moscow',
-                 'PASSPORT', 'R34567890', 'Arms Trafficking', 'Illegal arms trade',
-                 '2021-06-20', None, 'UNSCR 2374', None, None, 'HIGH'),
-                
-                # EU Consolidated List entries
-                ('EU', 'ENTITY', 'EU12345', 'مجموعة الإرهاب أ', 'Terror Group A',
-                 'تنظيم أ', 'Group A', 'SY', 'Syria', None, None,
-                 None, None, 'Terrorist Organization', 'Terrorism activities',
-                 '2018-09-05', None, None, 'EU Regulation 2020/123', None, 'HIGH'),
-                
-                ('EU', 'INDIVIDUAL', 'EU12346', 'خوان كارلوس', 'Juan Carlos',
-                 '', '', 'MX', 'Mexico', '1965-04-12', 'Mexico City',
-                 'PASSPORT', 'M56789012', 'Drug Trafficking', 'Narcotics distribution network',
-                 '2022-02-28', None, None, 'EU Regulation 2021/456', None, 'HIGH'),
-            ]
-            
-            # Insert sample data
-            self.cursor.executemany('''
-                INSERT INTO sanctions 
-                (list_source, list_type, reference_id, full_name_ar, full_name_en,
-                 alias_ar, alias_en, nationality_code, nationality_name, date_of_birth,
-                 place_of_birth, id_type, id_number, designation, reason,
-                 effective_date, expiry_date, un_resolution, eu_regulation, ofac_id, risk_level)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', sample_sanctions)
-            
-            self.conn.commit()
-            logger.info(f"✅ Successfully loaded {len(sample_sanctions)} sample sanctions")
+            self.sanctions_version += 1
+            self.cursor.execute("ANALYZE")  # Refresh planner statistics for the new rows
+            logger.info(f"✅ Successfully loaded {len(_SAMPLE_SANCTIONS)} sample sanctions")
+            if self.sanctions_matrix is not None:
+                self.load_sanctions_matrix()
             return True
             
         except sqlite3.Error as e:
@@ -330,6 +807,132 @@ class KYCDatabase:
             self.conn.rollback()
             return False
     
+    @_writer
+    def bulk_load_sanctions(self, rows, chunk_size: int = 10_000,
+                            initial_load: bool = False) -> bool:
+        """
+        Insert sanctions rows in large chunks inside a single transaction
+        
+        With initial_load=True the connection switches to SQLite's bulk-load
+        settings (no fsync, in-memory rollback journal, exclusive lock) for
+        the duration and restores its previous journal and sync modes
+        afterwards. A crash mid-load can corrupt the database in that mode,
+        so only use it to populate a fresh database before it is serving
+        requests.
+        
+        Args:
+            rows (iterable): Tuples in _SANCTION_COLUMNS order
+            chunk_size (int): Rows passed to each executemany call
+            initial_load (bool): Trade durability for speed (see above)
+        
+        Returns:
+            bool: True if all rows were loaded, False otherwise
+        """
+        if not self.connected:
+            logger.error("❌ Cannot load sanctions: No active connection")
+            return False
+        
+        saved_pragmas = None
+        if initial_load:
+            # Changing the journal mode away from WAL needs the only open
+            # connection to the database
+            self.close_idle_readers()
+            saved_pragmas = {name: self.conn.execute(f"PRAGMA {name}").fetchone()[0]
+                             for name in ('journal_mode', 'synchronous')}
+            self.conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+            self.conn.execute("PRAGMA journal_mode = MEMORY")
+            self.conn.execute("PRAGMA synchronous = OFF")
+        
+        try:
+            loaded = 0
+            rows = iter(rows)
+            self.cursor.execute("BEGIN IMMEDIATE")
+            # Check foreign keys once at COMMIT rather than on every INSERT;
+            # violations still abort the load. Resets when the transaction ends.
+            self.cursor.execute("PRAGMA defer_foreign_keys = ON")
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                self.cursor.executemany(_INSERT_SANCTION_SQL, _sanction_rows(chunk))
+                loaded += len(chunk)
+            self.conn.commit()
+        
+        except sqlite3.Error as e:
+            logger.error(f"❌ Error loading sanctions: {e}")
+            self.conn.rollback()
+            return False
+        
+        except BaseException:
+            # Rows are produced lazily, so reading or parsing errors surface
+            # here too; never leave the writer inside the open transaction
+            self.conn.rollback()
+            raise
+        
+        finally:
+            if saved_pragmas is not None:
+                # Leave exclusive mode before re-entering WAL, otherwise WAL
+                # keeps its index in private memory and other connections
+                # stay locked out. The lock is only dropped by the next read.
+                self.conn.execute("PRAGMA locking_mode = NORMAL")
+                self.conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+                self.conn.execute(f"PRAGMA journal_mode = {saved_pragmas['journal_mode']}")
+                self.conn.execute(f"PRAGMA synchronous = {saved_pragmas['synchronous']}")
+        
+        self.sanctions_version += 1
+        self.cursor.execute("ANALYZE")
+        if self.sanctions_matrix is not None:
+            self.load_sanctions_matrix()
+        
+        logger.info(f"✅ Successfully loaded {loaded} sanctions")
+        return True
+    
+    def load_sanctions_csv(self, csv_path: str, initial_load: bool = False) -> bool:
+        """
+        Stream a sanctions CSV file into bulk_load_sanctions
+        
+        The header row names the columns: any of _SANCTION_COLUMNS, in any
+        order. Unknown columns are ignored and missing or blank fields load
+        as NULL. Rows are parsed as bulk_load_sanctions consumes them, so
+        the file is never held in memory.
+        
+        Args:
+            csv_path (str): CSV file with a header row
+            initial_load (bool): Passed through to bulk_load_sanctions
+        
+        Returns:
+            bool: True if every row was loaded, False otherwise
+        """
+        try:
+            with open(csv_path, newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header:
+                    logger.error(f"❌ Error loading sanctions CSV: {csv_path} is empty")
+                    return False
+                
+                # Missing columns point one past the header, at a blank field
+                # put there in every row (after dropping any surplus fields),
+                # so one itemgetter call reorders a row
+                positions = {name.strip(): i for i, name in enumerate(header)}
+                blank = len(header)
+                pick = operator.itemgetter(*(positions.get(column, blank) for column in _SANCTION_COLUMNS))
+                
+                def sanction_rows():
+                    for row in reader:
+                        if not row:
+                            continue
+                        del row[blank:]
+                        row.extend([''] * (blank + 1 - len(row)))
+                        yield tuple([value.strip() or None for value in pick(row)])
+                
+                return self.bulk_load_sanctions(sanction_rows(), initial_load=initial_load)
+        
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            logger.error(f"❌ Error loading sanctions CSV: {e}")
+            return False
+    
+    @_writer
     def add_customer(self, customer_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Add a new customer to the database
@@ -344,49 +947,21 @@ class KYCDatabase:
             return False, "Database not connected"
         
         try:
-            # Validate required fields
-            required_fields = ['customer_code', 'full_name_en', 'nationality_code', 'id_number']
-            for field in required_fields:
-                if field not in customer_data or not customer_data[field]:
-                    return False, f"Missing required field: {field}"
+            error = _validate_customer_fields(customer_data)
+            if error:
+                return False, error
             
-            # Check for duplicate ID number
-            self.cursor.execute(
-                "SELECT COUNT(*) FROM customers WHERE id_number = ?",
-                (customer_data['id_number'],)
-            )
-            if self.cursor.fetchone()[0] > 0:
-                return False, "ID number already exists in database"
+            # Acquire the write lock up front rather than upgrading from a
+            # read lock at INSERT time, which can fail with SQLITE_BUSY
+            self.cursor.execute("BEGIN IMMEDIATE")
             
-            # Check for duplicate customer code
-            self.cursor.execute(
-                "SELECT COUNT(*) FROM customers WHERE customer_code = ?",
-                (customer_data['customer_code'],)
-            )
-            if self.cursor.fetchone()[0] > 0:
-                return False, "Customer code already exists"
-            
-            # Prepare data for insertion
-            columns = []
-            values = []
-            placeholders = []
-            
-            for key, value in customer_data.items():
-                if value is not None:
-                    columns.append(key)
-                    values.append(value)
-                    placeholders.append('?')
-            
-            # Build and execute insert query
-            query = f'''
-                INSERT INTO customers ({', '.join(columns)})
-                VALUES ({', '.join(placeholders)})
-            '''
-            
-            self.cursor.execute(query, values)
+            # Duplicate ID numbers and customer codes are rejected by their
+            # UNIQUE indexes
+            self.cursor.execute(_INSERT_CUSTOMER_SQL, _customer_row(customer_data))
             customer_id = self.cursor.lastrowid
+            self.conn.commit()
             
-            # Log the action
+            # Log the action (queued only once the customer is committed)
             self._log_audit_action(
                 action_type='CREATE_CUSTOMER',
                 entity_type='CUSTOMER',
@@ -394,9 +969,18 @@ class KYCDatabase:
                 details=f"Added new customer: {customer_data.get('full_name_en')}"
             )
             
-            self.conn.commit()
             logger.info(f"✅ Customer added successfully: {customer_data.get('full_name_en')}")
             return True, "Customer added successfully"
+        
+        except sqlite3.IntegrityError as e:
+            self.conn.rollback()
+            if 'customers.id_number' in str(e):
+                return False, "ID number already exists in database"
+            if 'customers.customer_code' in str(e):
+                return False, "Customer code already exists"
+            error_msg = f"Database error: {str(e)}"
+            logger.error(f"❌ Error adding customer: {error_msg}")
+            return False, error_msg
             
         except sqlite3.Error as e:
             self.conn.rollback()
@@ -404,6 +988,145 @@ class KYCDatabase:
             logger.error(f"❌ Error adding customer: {error_msg}")
             return False, error_msg
     
+    @_writer
+    def add_customers(self, customers, chunk_size: int = 500) -> Tuple[int, List[str]]:
+        """
+        Add many customers, one transaction and one executemany per chunk
+        
+        Records that are invalid or duplicate an ID number or customer code
+        (in the database or earlier in the input) are skipped and reported;
+        the rest are inserted. Any other constraint failure rolls back the
+        whole chunk it occurred in.
+        
+        Args:
+            customers (iterable): Customer dictionaries, as for add_customer
+            chunk_size (int): Records per transaction. Each chunk binds two
+                IN (...) lists of this size, so keep it under SQLite's
+                host-parameter limit (999 on older builds).
+        
+        Returns:
+            tuple: (added, errors) where added is the number of customers
+                inserted and errors lists a message per skipped record
+        """
+        if not self.connected:
+            return 0, ["Database not connected"]
+        
+        added = 0
+        errors = []
+        seen_codes = set()
+        seen_ids = set()
+        customers = iter(customers)
+        
+        while True:
+            chunk = list(itertools.islice(customers, chunk_size))
+            if not chunk:
+                break
+            
+            # Validate and drop duplicates within the input
+            candidates = []
+            for customer_data in chunk:
+                label = customer_data.get('customer_code') or '<no code>'
+                error = _validate_customer_fields(customer_data)
+                if error is None and customer_data['customer_code'] in seen_codes:
+                    error = "Customer code already exists"
+                if error is None and customer_data['id_number'] in seen_ids:
+                    error = "ID number already exists in database"
+                if error:
+                    errors.append(f"{label}: {error}")
+                    continue
+                seen_codes.add(customer_data['customer_code'])
+                seen_ids.add(customer_data['id_number'])
+                candidates.append(customer_data)
+            
+            if not candidates:
+                continue
+            
+            try:
+                self.cursor.execute("BEGIN IMMEDIATE")
+                
+                # Drop duplicates already in the database, one query per key
+                codes = [c['customer_code'] for c in candidates]
+                ids = [c['id_number'] for c in candidates]
+                placeholders = ', '.join('?' * len(candidates))
+                self.cursor.execute(
+                    f"SELECT customer_code FROM customers WHERE customer_code IN ({placeholders})", codes)
+                existing_codes = {row[0] for row in self.cursor.fetchall()}
+                self.cursor.execute(
+                    f"SELECT id_number FROM customers WHERE id_number IN ({placeholders})", ids)
+                existing_ids = {row[0] for row in self.cursor.fetchall()}
+                
+                rows = []
+                inserted = []
+                for customer_data in candidates:
+                    if customer_data['customer_code'] in existing_codes:
+                        errors.append(f"{customer_data['customer_code']}: Customer code already exists")
+                    elif customer_data['id_number'] in existing_ids:
+                        errors.append(f"{customer_data['customer_code']}: ID number already exists in database")
+                    else:
+                        rows.append(_customer_row(customer_data))
+                        inserted.append(customer_data)
+                
+                self.cursor.executemany(_INSERT_CUSTOMER_SQL, rows)
+                self.conn.commit()
+                added += len(rows)
+            
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                error_msg = f"Database error: {str(e)}"
+                logger.error(f"❌ Error adding customers: {error_msg}")
+                errors.append(f"{len(candidates)} record(s) not added: {error_msg}")
+                continue
+            
+            for customer_data in inserted:
+                self._log_audit_action(
+                    action_type='CREATE_CUSTOMER',
+                    entity_type='CUSTOMER',
+                    entity_id=customer_data['customer_code'],
+                    details=f"Added new customer: {customer_data.get('full_name_en')}"
+                )
+        
+        logger.info(f"✅ Added {added} customers ({len(errors)} skipped)")
+        return added, errors
+    
+    def load_sanctions_matrix(self) -> Optional[Dict[str, tuple]]:
+        """
+        Load the sanctions columns used for scoring into column-oriented tuples
+        
+        Each key of the result maps to one tuple holding that column for every
+        sanction, in id order, so a scorer scanning names touches only names.
+        Names come pre-normalised from the *_norm columns and English aliases
+        are normalised once here, so screening can score the matrix directly.
+        The database stays authoritative; the matrix is rebuilt after
+        sanctions are (bulk) loaded.
+        
+        Returns:
+            dict: Column name -> tuple of values, or None on error
+        """
+        if not self.connected:
+            return None
+        
+        try:
+            with self.read_conn() as conn:
+                rows = conn.execute(
+                    f"SELECT {', '.join(_SANCTIONS_MATRIX_COLUMNS)} FROM sanctions ORDER BY id"
+                ).fetchall()
+            
+            columns = zip(*rows) if rows else [()] * len(_SANCTIONS_MATRIX_COLUMNS)
+            matrix = {name: tuple(values) for name, values in zip(_SANCTIONS_MATRIX_COLUMNS, columns)}
+            matrix['alias_en'] = tuple(StringUtils.normalize_english_batch(matrix['alias_en']))
+            # Interned like the customer's code, so the nationality comparison
+            # in screening is an identity check rather than a string compare
+            matrix['nationality_code'] = tuple(sys.intern(code) if code else code
+                                               for code in matrix['nationality_code'])
+            
+            self.sanctions_matrix = matrix
+            logger.info(f"✅ Loaded sanctions matrix: {len(matrix['id'])} records")
+            return matrix
+        
+        except sqlite3.Error as e:
+            logger.error(f"❌ Error loading sanctions matrix: {e}")
+            return None
+    
     def get_customer(self, customer_code: str) -> Optional[Dict]:
         """
         Retrieve customer information by customer code
@@ -412,19 +1135,20 @@ class KYCDatabase:
             customer_code (str): Unique customer identifier
         
         Returns:
-            dict: Customer information or None if not found
+            dict: Customer information (_CUSTOMER_VIEW_COLUMNS) or None if not found
         """
         if not self.connected:
             return None
         
         try:
-            self.cursor.execute('''
-                SELECT * FROM customers WHERE customer_code = ?
-            ''', (customer_code,))
+            with self.read_conn() as conn:
+                rows = _fetch_dicts(conn.execute(f'''
+                    SELECT {', '.join(_CUSTOMER_VIEW_COLUMNS)}
+                    FROM customers WHERE customer_code = ?
+                ''', (customer_code,)))
             
-            row = self.cursor.fetchone()
-            if row:
-                return dict(row)
+            if rows:
+                return rows[0]
             return None
             
         except sqlite3.Error as e:
@@ -446,23 +1170,38 @@ class KYCDatabase:
             return []
         
         try:
-            query = '''
-                SELECT * FROM sanctions 
-                WHERE full_name_en LIKE ? 
-                   OR full_name_ar LIKE ? 
-                   OR alias_en LIKE ? 
-                   OR alias_ar LIKE ?
-                ORDER BY risk_level DESC, full_name_en
-                LIMIT 50
-            '''
-            
-            search_pattern = f"%{search_term}%"
-            self.cursor.execute(query, (search_pattern, search_pattern, 
-                                       search_pattern, search_pattern))
-            
-            results = []
-            for row in self.cursor.fetchall():
-                results.append(dict(row))
+            search_key = _search_key(search_term)
+            if not search_key and search_term:
+                # Only punctuation: an empty key would match every sanction
+                return []
+            if self.fts_enabled and search_key:
+                # Phrase-prefix query: the words in order, the last one as a prefix
+                fts_query = '"' + search_key.replace('"', '""') + '"*'
+                with self.read_conn() as conn:
+                    results = _fetch_dicts(conn.execute(f'''
+                        SELECT {', '.join('s.' + column for column in _SANCTION_VIEW_COLUMNS)}
+                        FROM sanctions_fts f
+                        JOIN sanctions s ON s.id = f.rowid
+                        WHERE sanctions_fts MATCH ?
+                        ORDER BY f.rank
+                        LIMIT 50
+                    ''', (fts_query,)))
+            else:
+                query = f'''
+                    SELECT {', '.join(_SANCTION_VIEW_COLUMNS)} FROM sanctions
+                    WHERE full_name_en_norm LIKE ? 
+                       OR full_name_ar_norm LIKE ? 
+                       OR alias_en LIKE ? 
+                       OR alias_ar LIKE ?
+                    ORDER BY risk_level DESC, full_name_en
+                    LIMIT 50
+                '''
+                
+                key_pattern = f"%{search_key}%"
+                search_pattern = f"%{search_term}%"
+                with self.read_conn() as conn:
+                    results = _fetch_dicts(conn.execute(query, (key_pattern, key_pattern,
+                                                                search_pattern, search_pattern)))
             
             logger.info(f"🔍 Found {len(results)} sanctions for search term: '{search_term}'")
             return results
@@ -471,6 +1210,45 @@ class KYCDatabase:
             logger.error(f"❌ Error searching sanctions: {e}")
             return []
     
+    def get_sanction_candidates(self, name: str, limit: int = 100) -> List[Dict]:
+        """
+        Shortlist sanctions that share at least one name token with a name
+        
+        Unlike search_sanctions, the words need not appear together or in
+        order, so names that are spelt or ordered differently still reach
+        fuzzy scoring. Candidates sharing more (and rarer) tokens rank first.
+        
+        Args:
+            name (str): Name to screen
+            limit (int): Maximum number of candidates
+        
+        Returns:
+            list: Candidate sanctions (_SANCTION_VIEW_COLUMNS), best first
+        """
+        if not self.connected:
+            return []
+        
+        tokens = _search_key(name).split()
+        if not self.fts_enabled or not tokens:
+            return self.search_sanctions(name)
+        
+        # Each token as a quoted prefix term, any of them may match
+        fts_query = ' OR '.join('"' + token.replace('"', '""') + '"*' for token in tokens)
+        try:
+            with self.read_conn() as conn:
+                return _fetch_dicts(conn.execute(f'''
+                    SELECT {', '.join('s.' + column for column in _SANCTION_VIEW_COLUMNS)}
+                    FROM sanctions_fts f
+                    JOIN sanctions s ON s.id = f.rowid
+                    WHERE sanctions_fts MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                ''', (fts_query, limit)))
+        
+        except sqlite3.Error as e:
+            logger.error(f"❌ Error shortlisting sanctions: {e}")
+            return []
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get database statistics
@@ -484,45 +1262,46 @@ class KYCDatabase:
             return stats
         
         try:
-            # Basic counts
-            tables = ['customers', 'sanctions', 'screening_results', 'sanction_matches']
-            for table in tables:
-                self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                stats[f'total_{table}'] = self.cursor.fetchone()[0]
+            with self.read_conn() as conn:
+                # Basic counts, all four in one statement
+                row = conn.execute('''
+                    SELECT (SELECT COUNT(*) FROM customers),
+                           (SELECT COUNT(*) FROM sanctions),
+                           (SELECT COUNT(*) FROM screening_results),
+                           (SELECT COUNT(*) FROM sanction_matches)
+                ''').fetchone()
+                
+                # Distributions, tagged with the stats key they belong to
+                distributions = conn.execute('''
+                    SELECT 'risk_distribution', risk_category, COUNT(*)
+                    FROM customers
+                    GROUP BY risk_category
+                    UNION ALL
+                    SELECT 'sanctions_by_source', list_source, COUNT(*)
+                    FROM sanctions
+                    GROUP BY list_source
+                    UNION ALL
+                    SELECT 'screening_results', screening_result, COUNT(*)
+                    FROM screening_results
+                    GROUP BY screening_result
+                    UNION ALL
+                    SELECT 'recent_activity', DATE(created_at), COUNT(*)
+                    FROM customers
+                    WHERE created_at >= DATE('now', '-30 days')
+                    GROUP BY DATE(created_at)
+                ''').fetchall()
             
-            # Customer risk distribution
-            self.cursor.execute('''
-                SELECT risk_category, COUNT(*) as count 
-                FROM customers 
-                GROUP BY risk_category
-            ''')
-            stats['risk_distribution'] = dict(self.cursor.fetchall())
+            tables = ['customers', 'sanctions', 'screening_results', 'sanction_matches']
+            for table, count in zip(tables, row):
+                stats[f'total_{table}'] = count
             
-            # Sanctions by source
-            self.cursor.execute('''
-                SELECT list_source, COUNT(*) as count 
-                FROM sanctions 
-                GROUP BY list_source
-            ''')
-            stats['sanctions_by_source'] = dict(self.cursor.fetchall())
+            for key in ('risk_distribution', 'sanctions_by_source', 'screening_results', 'recent_activity'):
+                stats[key] = {}
+            for key, group, count in distributions:
+                stats[key][group] = count
             
-            # Screening results distribution
-            self.cursor.execute('''
-                SELECT screening_result, COUNT(*) as count 
-                FROM screening_results 
-                GROUP BY screening_result
-            ''')
-            stats['screening_results'] = dict(self.cursor.fetchall())
-            
-            # Recent activity
-            self.cursor.execute('''
-                SELECT DATE(created_at) as date, COUNT(*) as count
-                FROM customers
-                WHERE created_at >= DATE('now', '-30 days')
-                GROUP BY DATE(created_at)
-                ORDER BY date DESC
-            ''')
-            stats['recent_activity'] = dict(self.cursor.fetchall())
+            # Most recent day first
+            stats['recent_activity'] = dict(sorted(stats['recent_activity'].items(), reverse=True))
             
             return stats
             
@@ -544,9 +1323,20 @@ class KYCDatabase:
         if not self.connected:
             return False
         
+        if table_name not in _EXPORTABLE_TABLES:
+            logger.error(f"❌ Error exporting to CSV: unknown table '{table_name}'")
+            return False
+        
         try:
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", self.conn)
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            # Stream rows from the cursor straight into the file rather than
+            # materialising the whole table in memory first
+            with self.read_conn() as conn, \
+                    open(output_file, 'w', newline='', encoding='utf-8-sig',
+                         buffering=_CSV_BUFFER_SIZE) as f:
+                cursor = conn.execute(f"SELECT * FROM {table_name}")
+                writer = csv.writer(f)
+                writer.writerow([column[0] for column in cursor.description])
+                writer.writerows(cursor)
             logger.info(f"✅ Exported {table_name} to {output_file}")
             return True
         except Exception as e:
@@ -556,7 +1346,10 @@ class KYCDatabase:
     def _log_audit_action(self, action_type: str, entity_type: str = None, 
                          entity_id: str = None, details: str = None) -> None:
         """
-        Log an action to the audit log
+        Queue an action for the audit log
+        
+        The row is written by the background audit writer, so it is not part
+        of the caller's transaction.
         
         Args:
             action_type (str): Type of action performed
@@ -564,13 +1357,45 @@ class KYCDatabase:
             entity_id (str): ID of entity affected
             details (str): Additional details
         """
-        try:
-            self.cursor.execute('''
-                INSERT INTO audit_log (action_type, entity_type, entity_id, details)
-                VALUES (?, ?, ?, ?)
-            ''', (action_type, entity_type, entity_id, details))
-        except Exception as e:
-            logger.error(f"❌ Error logging audit action: {e}")
+        if self._audit_queue is None:
+            logger.error(f"❌ Error logging audit action: No active connection ({action_type})")
+            return
+        self._audit_queue.put((action_type, entity_type, entity_id, details))
+    
+    def _audit_writer(self) -> None:
+        """Background loop writing queued audit entries until a None sentinel arrives"""
+        audit_queue = self._audit_queue
+        while True:
+            entry = audit_queue.get()
+            if entry is None:
+                return
+            
+            batch = [entry]
+            stop = False
+            while len(batch) < _AUDIT_BATCH_SIZE:
+                try:
+                    entry = audit_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+            
+            with self._write_lock:
+                try:
+                    self.conn.execute("BEGIN IMMEDIATE")
+                    self.conn.executemany('''
+                        INSERT INTO audit_log (action_type, entity_type, entity_id, details)
+                        VALUES (?, ?, ?, ?)
+                    ''', batch)
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"❌ Error logging audit action: {e}")
+                    self.conn.rollback()
+            
+            if stop:
+                return
     
     def __enter__(self):
         """Context manager entry"""
@@ -581,10 +1406,30 @@ class KYCDatabase:
         """Context manager exit"""
         self.disconnect()
 
-# Utility function for quick database access
+# Utility functions for quick database access
+_shared_db = None
+_shared_db_lock = threading.Lock()
+
 def get_database_connection():
-    """Get a database connection for quick operations"""
-    db = KYCDatabase()
-    if db.connect():
-        return db
-    return None
\ No newline at end of file
+    """
+    Get the process-wide database connection for quick operations
+    
+    The first call connects; later calls return the same warm instance.
+    A failed connect is not remembered, so the next call tries again.
+    """
+    global _shared_db
+    with _shared_db_lock:
+        if _shared_db is None:
+            db = KYCDatabase()
+            if not db.connect():
+                return None
+            _shared_db = db
+        return _shared_db
+
+def close_database_connection():
+    """Close the process-wide connection opened by get_database_connection"""
+    global _shared_db
+    with _shared_db_lock:
+        if _shared_db is not None:
+            _shared_db.disconnect()
+            _shared_db = None
\ No newline at end of file
@@ -8,11 +8,30 @@ Contact: muhammadalaa.rt@gmail.com
 
 import sys
 import os
-import json
+
+def _version_text() -> str:
+    """Text printed by --version"""
+    import config
+    return f"{config.APP_NAME} v{config.APP_VERSION}\nDeveloped by: {config.DEVELOPER_NAME}"
+
+# Answer a bare --version before the database and matching modules are
+# imported and logging opens its file; everything else goes to argparse
+if __name__ == "__main__" and sys.argv[1:] in (['-v'], ['--version']):
+    print(_version_text())
+    sys.exit(0)
+
+import argparse
+import atexit
 import csv
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import logging
+import logging.config
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -22,23 +41,105 @@ from database import KYCDatabase
 import config
 from utils import (
     StringUtils, DateUtils, ValidationUtils, 
-    RiskCalculator, ReportGenerator
+    RiskCalculator, ReportGenerator, MatchResult, write_json_file
 )
 
 # ==================== LOGGING CONFIGURATION ====================
 
-logging.basicConfig(
-    level=getattr(logging, config.LOGGING_CONFIG['level']),
-    format=config.LOGGING_CONFIG['format'],
-    datefmt=config.LOGGING_CONFIG['date_format'],
-    handlers=[
-        logging.FileHandler(config.LOGGING_CONFIG['log_file']),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+logging.config.dictConfig(config.LOGGING_CONFIG)
 
 logger = logging.getLogger(__name__)
 
+# Most screening outcomes kept by KYCScreeningTool._screen_with_cache
+_SCREENING_CACHE_SIZE = 10000
+
+# Most customers screen_csv_file keeps in flight between reading and writing
+_BATCH_SIZE = 1000
+_CSV_BUFFER_SIZE = 1024 * 1024
+_BATCH_EXPORT_FIELDS = ('customer_code', 'screening_result', 'risk_score', 'risk_level', 'matches', 'errors')
+
+# ==================== SCREEN TEXT ====================
+# Rendered once at import; the menu is printed on every pass of run()
+_BANNER = f"""
+        ╔══════════════════════════════════════════════════════════════╗
+        ║                                                              ║
+        ║         🔍 KYC & SANCTIONS SCREENING TOOL                   ║
+        ║                     Version {config.APP_VERSION}                         ║
+        ║                                                              ║
+        ║      Automated Customer Due Diligence and Compliance        ║
+        ║                                                              ║
+        ║       Developer: {config.DEVELOPER_NAME}      ║
+        ║       Contact: {config.DEVELOPER_EMAIL}    ║
+        ║                                                              ║
+        ╚══════════════════════════════════════════════════════════════╝
+        """
+
+_MENU = f"""
+        📋 MAIN MENU - {config.APP_NAME}
+        {'=' * 60}
+        
+        1. 🆕 Screen New Customer
+        2. 📋 View Screening History
+        3. 🔍 Search Sanctions List
+        4. 📊 View Statistics
+        5. 💾 Export Data
+        6. ⚙️  System Configuration
+        7. 📄 Generate Report
+        8. 🆘 Help & Documentation
+        9. 📥 Batch Screening (CSV)
+        10. 🚪 Exit
+        
+        {'=' * 60}
+        """
+
+# Only the date is filled in per call, with str.format
+_HELP_TEXT = f"""
+        KYC & Sanctions Screening Tool - Help Guide
+        {'=' * 50}
+        
+        Overview:
+        This tool automates customer due diligence and sanctions screening
+        for compliance with anti-money laundering (AML) regulations.
+        
+        Key Features:
+        1. Customer Screening - Screen new customers against sanctions lists
+        2. Risk Assessment - Calculate risk scores based on multiple factors
+        3. Sanctions Search - Search through sanctions databases
+        4. Reporting - Generate compliance reports
+        5. Data Export - Export screening results and statistics
+        6. Batch Screening - Screen every customer in a CSV file
+        
+        Usage Tips:
+        - Ensure customer data is accurate before screening
+        - Review all matches carefully before making decisions
+        - Export reports for compliance documentation
+        - Regularly update sanctions lists
+        
+        Configuration:
+        Edit config.py to customize:
+        - High-risk countries list
+        - PEP indicators
+        - Screening thresholds
+        - Database settings
+        
+        Support:
+        For issues or questions, contact:
+        - Email: {config.DEVELOPER_EMAIL}
+        - Phone: {config.DEVELOPER_PHONE}
+        
+        Version: {config.APP_VERSION}
+        Last Updated: {{last_updated}}
+        """
+
+_EXIT_HEADER = "\n" + "=" * 60 + "\n🚪 EXITING APPLICATION\n" + "=" * 60
+
+_GOODBYE = (
+    f"\nThank you for using {config.APP_NAME}!\n"
+    f"Developed by: {config.DEVELOPER_NAME}\n"
+    f"Contact: {config.DEVELOPER_EMAIL}\n"
+    "\nGoodbye! 👋"
+)
+
 # ==================== MAIN APPLICATION CLASS ====================
 
 class KYCScreeningTool:
@@ -53,12 +154,42 @@ class KYCScreeningTool:
     - Database operations
     """
     
+    # Main menu choice -> handler method name
+    _MENU_ACTIONS = {
+        '1': 'screen_new_customer',
+        '2': 'view_screening_history',
+        '3': 'search_sanctions_list',
+        '4': 'view_statistics',
+        '5': 'export_data',
+        '6': 'system_configuration',
+        '7': 'generate_report',
+        '8': 'show_help',
+        '9': 'batch_screening',
+        '10': 'exit_application',
+    }
+    _EXIT_CHOICE = '10'
+    
     def __init__(self):
         """Initialize the KYC Screening Tool"""
         self.db = None
         self.risk_calculator = None
+        self._pool = None  # Worker threads for screen_batch
         self.current_user = os.getenv('USER', 'SYSTEM')
         
+        # (name, dob, nationality, sanctions version) -> matches, LRU order
+        self._screening_cache = OrderedDict()
+        self._screening_cache_lock = threading.Lock()
+        
+        # Suffix for generated codes after the microsecond timestamp. Only its
+        # low 8 bits are used, so it wraps every 256 codes: codes stay unique
+        # as long as this process generates at most 256 per microsecond
+        self._id_counter = itertools.count()
+        
+        # Runs even when the process leaves through sys.exit() or an error
+        # instead of exit_application, so queued audit entries still reach
+        # the database and the worker threads are joined
+        atexit.register(self._release_resources)
+        
         self._initialize_application()
     
     def _initialize_application(self) -> None:
@@ -66,7 +197,10 @@ class KYCScreeningTool:
         try:
             # Display startup banner
             self._display_banner()
-            
+
+            # Create working directories (logs, exports, reports, ...)
+            config.create_directories()
+
             # Initialize database
             logger.info("Initializing database connection...")
             self.db = KYCDatabase(config.DATABASE_CONFIG['database'])
@@ -80,67 +214,53 @@ class KYCScreeningTool:
                 logger.error("Failed to initialize database. Exiting...")
                 sys.exit(1)
             
-            # Load sample sanctions data
+            # Load sample sanctions data and hold it in memory for screening
             self.db.load_sample_sanctions()
+            self.db.load_sanctions_matrix()
             
             # Initialize risk calculator
             self.risk_calculator = RiskCalculator(config)
             
+            # Compile the PEP indicator automaton now rather than on the first screen
+            config.PEP_MATCHER
+            
+            # Screens read through the database's reader pool and RapidFuzz
+            # releases the GIL while scoring, so batch screens run in threads
+            self._pool = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                            thread_name_prefix='kyc-screen')
+            
             logger.info("✅ KYC Screening Tool initialized successfully")
             
         except Exception as e:
             logger.error(f"❌ Application initialization failed: {e}")
             sys.exit(1)
     
+    def _next_id(self, prefix: str) -> str:
+        """Generate a unique code: prefix + hex microsecond timestamp + process counter"""
+        # 13 hex digits of microseconds + 2 of counter keeps CUST codes
+        # within customers.customer_code's VARCHAR(20)
+        return f"{prefix}{time.time_ns() // 1000:x}{next(self._id_counter) & 0xFF:02x}"
+    
     def _display_banner(self) -> None:
         """Display application banner"""
-        banner = f"""
-        ╔══════════════════════════════════════════════════════════════╗
-        ║                                                              ║
-        ║         🔍 KYC & SANCTIONS SCREENING TOOL                   ║
-        ║                     Version {config.APP_VERSION}                         ║
-        ║                                                              ║
-        ║      Automated Customer Due Diligence and Compliance        ║
-        ║                                                              ║
-        ║       Developer: {config.DEVELOPER_NAME}      ║
-        ║       Contact: {config.DEVELOPER_EMAIL}    ║
-        ║                                                              ║
-        ╚══════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
+        print(_BANNER)
     
     def _display_menu(self) -> None:
         """Display main menu"""
-        menu = f"""
-        📋 MAIN MENU - {config.APP_NAME}
-        {'=' * 60}
-        
-        1. 🆕 Screen New Customer
-        2. 📋 View Screening History
-        3. 🔍 Search Sanctions List
-        4. 📊 View Statistics
-        5. 💾 Export Data
-        6. ⚙️  System Configuration
-        7. 📄 Generate Report
-        8. 🆘 Help & Documentation
-        9. 🚪 Exit
-        
-        {'=' * 60}
-        """
-        print(menu)
+        print(_MENU)
     
     def _get_menu_choice(self) -> str:
         """Get user menu choice"""
         while True:
             try:
-                choice = input("\nEnter your choice (1-9): ").strip()
-                if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9']:
+                choice = input("\nEnter your choice (1-10): ").strip()
+                if choice in self._MENU_ACTIONS:
                     return choice
                 else:
-                    print("❌ Invalid choice. Please enter a number between 1 and 9.")
+                    print("❌ Invalid choice. Please enter a number between 1 and 10.")
             except KeyboardInterrupt:
                 print("\n\n⚠️  Operation cancelled by user.")
-                return '9'
+                return self._EXIT_CHOICE
             except Exception as e:
                 print(f"❌ Error: {e}")
     
@@ -151,26 +271,13 @@ class KYCScreeningTool:
                 self._display_menu()
                 choice = self._get_menu_choice()
                 
-                if choice == '1':
-                    self.screen_new_customer()
-                elif choice == '2':
-                    self.view_screening_history()
-                elif choice == '3':
-                    self.search_sanctions_list()
-                elif choice == '4':
-                    self.view_statistics()
-                elif choice == '5':
-                    self.export_data()
-                elif choice == '6':
-                    self.system_configuration()
-                elif choice == '7':
-                    self.generate_report()
-                elif choice == '8':
-                    self.show_help()
-                elif choice == '9':
-                    self.exit_application()
+                getattr(self, self._MENU_ACTIONS[choice])()
+                if choice == self._EXIT_CHOICE:
                     break
                 
+                # Don't hold pooled readers open while waiting on the user
+                self.db.close_idle_readers()
+                
                 input("\nPress Enter to continue...")
                 
         except KeyboardInterrupt:
@@ -206,7 +313,8 @@ class KYCScreeningTool:
             
             # Perform sanctions screening
             print("\n🔍 Screening customer against sanctions lists...")
-            matches = self._perform_sanctions_screening(customer_data)
+            screened_at = datetime.now()
+            matches = self._screen_with_cache(customer_data)
             
             # Calculate risk assessment
             risk_assessment = self.risk_calculator.calculate_customer_risk(customer_data, matches)
@@ -224,7 +332,8 @@ class KYCScreeningTool:
             
             # Generate report
             report = self._generate_screening_report(
-                screening_id, customer_data, matches, risk_assessment, screening_result
+                screening_id, customer_data, matches, risk_assessment, screening_result,
+                screened_at
             )
             
             # Ask to save customer
@@ -243,6 +352,131 @@ class KYCScreeningTool:
             logger.error(f"Error in customer screening: {e}")
             print(f"❌ Screening error: {e}")
     
+    def batch_screening(self) -> None:
+        """Screen every customer in a CSV file and export the outcomes"""
+        print("\n" + "=" * 60)
+        print("📥 BATCH SCREENING")
+        print("=" * 60)
+        
+        csv_path = input("\nCSV file path (columns as in the customer form): ").strip()
+        if not csv_path:
+            print("❌ File path cannot be empty.")
+            return
+        
+        try:
+            self.run_batch(csv_path)
+        except Exception as e:
+            logger.error(f"Error in batch screening: {e}")
+            print(f"❌ Batch screening error: {e}")
+    
+    def run_batch(self, csv_path: str, batch_size: int = _BATCH_SIZE) -> bool:
+        """
+        Screen every customer in a CSV file, export the outcomes and print a summary
+        
+        Args:
+            csv_path (str): CSV file with a header row of customer field names
+            batch_size (int): Most customers in flight at once
+        
+        Returns:
+            bool: True if the file was screened, False otherwise
+        """
+        export_file = f"exports/batch_screening_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        try:
+            summary = self.screen_csv_file(csv_path, export_file, batch_size)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            logger.error(f"Error in batch screening: {e}")
+            print(f"❌ Batch screening error: {e}")
+            return False
+        
+        total = sum(summary.values())
+        if not total:
+            print("\n⚠️  No customers found in file.")
+            return True
+        
+        print(f"\n✅ Screened {total} customers:")
+        for outcome, count in sorted(summary.items()):
+            print(f"   {outcome}: {count}")
+        print(f"\n📄 Results exported to: {export_file}")
+        return True
+    
+    def screen_csv_file(self, csv_path: str, output_file: str,
+                        batch_size: int = _BATCH_SIZE) -> Dict[str, int]:
+        """
+        Stream customers from a CSV file through the worker pool into a results CSV
+        
+        Each row is handed to the pool as soon as it is read, and results are
+        written in file order as they complete. Reading stalls once
+        batch_size customers are in flight, so the workers never wait on a
+        batch boundary and memory use is bounded by the batch size rather
+        than by the file size. The results are written to a temporary file
+        beside output_file and moved into place only once the whole input
+        has been screened, so a failed run never leaves a partial export.
+        
+        Args:
+            csv_path (str): CSV file with a header row of customer field names
+            output_file (str): Path of the results CSV to write
+            batch_size (int): Most customers in flight at once
+        
+        Returns:
+            dict: Number of customers per screening result
+        """
+        summary = {}
+        partial_file = f"{output_file}.part"
+        try:
+            self._screen_csv_into(csv_path, partial_file, batch_size, summary)
+            os.replace(partial_file, output_file)
+        except BaseException:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+            raise
+        
+        logger.info(f"Batch screening completed for {sum(summary.values())} customers")
+        return summary
+    
+    def _screen_csv_into(self, csv_path: str, output_file: str, batch_size: int,
+                         summary: Dict[str, int]) -> None:
+        """Body of screen_csv_file: screen csv_path into output_file, counting outcomes"""
+        with open(csv_path, newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as src, \
+                open(output_file, 'w', newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as dst:
+            writer = csv.DictWriter(dst, fieldnames=_BATCH_EXPORT_FIELDS)
+            writer.writeheader()
+            
+            def write(result: Dict[str, Any]) -> None:
+                outcome = result['screening_result']
+                summary[outcome] = summary.get(outcome, 0) + 1
+                writer.writerow({
+                    'customer_code': result['customer_code'],
+                    'screening_result': outcome,
+                    'risk_score': result['risk_assessment'].get('risk_score'),
+                    'risk_level': result['risk_assessment'].get('risk_level'),
+                    'matches': len(result['matches']),
+                    'errors': '; '.join(result.get('errors', ())),
+                })
+            
+            pending = deque()
+            # Plain csv.reader lists, zipped with the header straight into the
+            # customer dict: DictReader would build a second dict per row
+            reader = csv.reader(src)
+            header = next(reader, [])
+            for row in reader:
+                if not row:
+                    continue  # Blank line, skipped as DictReader did
+                customer_data = self._csv_customer(header, row)
+                if len(pending) >= batch_size:
+                    write(pending.popleft().result())
+                pending.append(self._submit_customer(customer_data))
+            while pending:
+                write(pending.popleft().result())
+    
+    @staticmethod
+    def _csv_customer(header: List[str], row: List[str]) -> Dict[str, Any]:
+        """Customer record from a CSV row and its header, with blank fields dropped"""
+        customer_data = {key: value.strip() for key, value in zip(header, row)
+                         if key and value and value.strip()}
+        if customer_data.get('nationality_code'):
+            customer_data['nationality_code'] = sys.intern(customer_data['nationality_code'].upper())
+        return customer_data
+    
     def _collect_customer_information(self) -> Dict[str, Any]:
         """Collect customer information from user"""
         customer_data = {}
@@ -251,14 +485,14 @@ class KYCScreeningTool:
         print("-" * 40)
         
         # Generate customer code if not provided
-        default_code = f"CUST{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        default_code = self._next_id('CUST')
         customer_data['customer_code'] = input(f"Customer Code [{default_code}]: ").strip() or default_code
         
         # Basic information
         customer_data['full_name_en'] = input("Full Name (English): ").strip()
         customer_data['full_name_ar'] = input("Full Name (Arabic) [optional]: ").strip() or None
         customer_data['date_of_birth'] = input("Date of Birth (YYYY-MM-DD) [optional]: ").strip() or None
-        customer_data['nationality_code'] = input("Nationality Code (2 letters, e.g., EG): ").strip().upper()
+        customer_data['nationality_code'] = sys.intern(input("Nationality Code (2 letters, e.g., EG): ").strip().upper())
         customer_data['nationality_name'] = input("Nationality Name [optional]: ").strip() or None
         
         # ID Information
@@ -310,7 +544,7 @@ class KYCScreeningTool:
         
         # PEP check
         occupation = customer_data.get('occupation', '')
-        if StringUtils.contains_pep_indicator(occupation, config.PEP_INDICATORS):
+        if StringUtils.contains_pep_indicator(occupation):
             warnings.append("Customer may be a Politically Exposed Person (PEP)")
         
         return {
@@ -319,38 +553,170 @@ class KYCScreeningTool:
             'warnings': warnings
         }
     
-    def _perform_sanctions_screening(self, customer_data: Dict) -> List[Dict]:
-        """Perform sanctions screening for customer"""
+    def _screen_with_cache(self, customer_data: Dict, workers: int = -1) -> List[MatchResult]:
+        """Perform sanctions screening, reusing the result for a recently screened identity"""
+        # The sanctions version in the key retires entries whenever the lists change
+        key = (
+            StringUtils.normalize_english(customer_data.get('full_name_en', '')),
+            customer_data.get('date_of_birth'),
+            customer_data.get('nationality_code'),
+            self.db.sanctions_version,
+        )
+        with self._screening_cache_lock:
+            matches = self._screening_cache.get(key)
+            if matches is not None:
+                self._screening_cache.move_to_end(key)
+        if matches is not None:
+            logger.info("Sanctions screening served from cache")
+            return list(matches)
+        
+        matches = self._perform_sanctions_screening(customer_data, workers)
+        with self._screening_cache_lock:
+            self._screening_cache[key] = matches
+            if len(self._screening_cache) > _SCREENING_CACHE_SIZE:
+                self._screening_cache.popitem(last=False)
+        return list(matches)
+    
+    def screen_batch(self, customer_list: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Screen many customers concurrently, without prompting or saving
+        
+        Args:
+            customer_list (list): Customer records, as collected by
+                _collect_customer_information
+        
+        Returns:
+            list: One dict per customer, in input order, with customer_code,
+                matches, risk_assessment and screening_result (plus errors
+                for INVALID customers)
+        """
+        futures = [self._submit_customer(customer_data) for customer_data in customer_list]
+        results = [future.result() for future in futures]
+        logger.info(f"Batch screening completed for {len(results)} customers")
+        return results
+    
+    def _submit_customer(self, customer_data: Dict) -> Future:
+        """
+        Validate a customer and queue it on the worker pool for screening
+        
+        Customers failing _validate_customer_data are never screened, so
+        they cannot come back as CLEAR: the returned future already holds
+        an INVALID result listing the validation errors.
+        """
+        validation = self._validate_customer_data(customer_data)
+        if validation['is_valid']:
+            return self._pool.submit(self._screen_customer, customer_data)
+        
+        future = Future()
+        future.set_result({
+            'customer_code': customer_data.get('customer_code'),
+            'matches': [],
+            'risk_assessment': {},
+            'screening_result': 'INVALID',
+            'errors': validation['errors'],
+        })
+        return future
+    
+    def _screen_customer(self, customer_data: Dict) -> Dict[str, Any]:
+        """Screen and risk-score one customer for screen_batch and screen_csv_file"""
+        try:
+            # Already on a pool thread: score with this thread alone rather
+            # than starting a scorer thread per CPU for every worker
+            matches = self._screen_with_cache(customer_data, workers=1)
+            risk_assessment = self.risk_calculator.calculate_customer_risk(customer_data, matches)
+        except Exception as e:
+            # Recorded against this customer rather than aborting the batch
+            logger.error(f"Error screening customer {customer_data.get('customer_code')}: {e}")
+            return {
+                'customer_code': customer_data.get('customer_code'),
+                'matches': [],
+                'risk_assessment': {},
+                'screening_result': 'ERROR',
+                'errors': [str(e)],
+            }
+        return {
+            'customer_code': customer_data.get('customer_code'),
+            'matches': matches,
+            'risk_assessment': risk_assessment,
+            'screening_result': self._determine_screening_result(matches, risk_assessment),
+        }
+    
+    def _perform_sanctions_screening(self, customer_data: Dict, workers: int = -1) -> List[MatchResult]:
+        """Perform sanctions screening for customer (workers: see batch_name_similarity)"""
         matches = []
         
         # Search by name
         name_en = customer_data.get('full_name_en', '')
         if name_en:
-            sanctions = self.db.search_sanctions(name_en)
+            customer_norm = StringUtils.normalize_english(name_en)
+            
+            # Score against every sanction in the in-memory matrix when it is
+            # loaded, otherwise against a shortlist from the database
+            matrix = self.db.sanctions_matrix
+            if matrix is not None:
+                sanctions = None
+                names, aliases = matrix['full_name_en_norm'], matrix['alias_en']
+            else:
+                sanctions = self.db.get_sanction_candidates(name_en)
+                names, aliases = zip(*map(self._sanction_norms, sanctions)) if sanctions else ((), ())
+            
+            # Score every name and alias in one batch call, so the query is
+            # prepared and the scorer's worker threads started only once.
+            # Pairs below the match threshold come back as 0 and are skipped.
+            scores = StringUtils.batch_name_similarity(customer_norm, [*names, *aliases],
+                                                       config.NAME_MATCH_THRESHOLD, workers)
+            name_scores, alias_scores = scores[:len(names)], scores[len(names):]
             
-            for sanction in sanctions:
-                match_result = self._check_sanction_match(customer_data, sanction)
-                if match_result['is_match']:
+            for i, (name_score, alias_score) in enumerate(zip(name_scores, alias_scores)):
+                if not (name_score or alias_score):
+                    continue
+                if sanctions is not None:
+                    sanction = sanctions[i]
+                else:
+                    sanction = {column: values[i] for column, values in matrix.items()}
+                match_result = self._check_sanction_match(customer_data, sanction, customer_norm,
+                                                          (name_score, alias_score))
+                if match_result.is_match:
                     matches.append(match_result)
         
         return matches
     
-    def _check_sanction_match(self, customer_data: Dict, sanction: Dict) -> Dict[str, Any]:
+    @staticmethod
+    def _sanction_norms(sanction: Dict) -> tuple:
+        """Normalised (name, alias) of a sanction entry, cached on the dict"""
+        # Kept on the dict so screens that reuse the same sanction records
+        # normalise each one only once
+        sanction_name = sanction.get('_norm_name')
+        if sanction_name is None:
+            sanction_name = (sanction.get('full_name_en_norm')
+                             or StringUtils.normalize_english(sanction.get('full_name_en', '')))
+            sanction['_norm_name'] = sanction_name
+        alias_name = sanction.get('_norm_alias')
+        if alias_name is None:
+            alias_name = sanction['_norm_alias'] = StringUtils.normalize_english(sanction.get('alias_en', ''))
+        return sanction_name, alias_name
+    
+    def _check_sanction_match(self, customer_data: Dict, sanction: Dict,
+                              customer_norm: Optional[str] = None,
+                              name_scores: Optional[tuple] = None) -> MatchResult:
         """Check if customer matches a sanction entry"""
         # Name matching
-        customer_name = StringUtils.normalize_english(customer_data.get('full_name_en', ''))
-        sanction_name = StringUtils.normalize_english(sanction.get('full_name_en', ''))
-        alias_name = StringUtils.normalize_english(sanction.get('alias_en', ''))
-        
-        # Calculate match scores
-        name_match_score = StringUtils.similarity_ratio(customer_name, sanction_name)
-        alias_match_score = StringUtils.similarity_ratio(customer_name, alias_name) if alias_name else 0
+        if name_scores is not None:
+            name_match_score, alias_match_score = name_scores
+        else:
+            if customer_norm is None:
+                customer_norm = StringUtils.normalize_english(customer_data.get('full_name_en', ''))
+            sanction_name, alias_name = self._sanction_norms(sanction)
+            
+            # Calculate match scores
+            name_match_score = StringUtils.name_similarity(customer_norm, sanction_name)
+            alias_match_score = StringUtils.name_similarity(customer_norm, alias_name) if alias_name else 0
         
         # Use the highest score
         match_score = max(name_match_score, alias_match_score)
         
         # Determine match type
-        if match_score >= config.SCREENING_CONFIG['name_match_threshold']:
+        if match_score >= config.NAME_MATCH_THRESHOLD:
             is_match = True
             match_type = 'EXACT' if match_score >= 95 else 'PARTIAL'
         else:
@@ -371,26 +737,26 @@ class KYCScreeningTool:
             customer_data.get('nationality_code') == sanction.get('nationality_code')
         )
         
-        return {
-            'is_match': is_match,
-            'sanction_id': sanction['id'],
-            'sanction_name': sanction.get('full_name_en'),
-            'sanction_source': sanction.get('list_source'),
-            'match_type': match_type,
-            'match_score': min(match_score, 100),
-            'name_match_score': name_match_score,
-            'dob_match': dob_match,
-            'nationality_match': nationality_match,
-            'risk_level': sanction.get('risk_level', 'HIGH')
-        }
+        return MatchResult(
+            is_match=is_match,
+            sanction_id=sanction['id'],
+            sanction_name=sanction.get('full_name_en'),
+            sanction_source=sanction.get('list_source'),
+            match_type=match_type,
+            match_score=min(match_score, 100),
+            name_match_score=name_match_score,
+            dob_match=dob_match,
+            nationality_match=nationality_match,
+            risk_level=sanction.get('risk_level', 'HIGH'),
+        )
     
-    def _determine_screening_result(self, matches: List[Dict], risk_assessment: Dict) -> str:
+    def _determine_screening_result(self, matches: List[MatchResult], risk_assessment: Dict) -> str:
         """Determine final screening result"""
         if not matches:
             return 'CLEAR'
         
         # Check for exact matches
-        exact_matches = [m for m in matches if m['match_type'] == 'EXACT']
+        exact_matches = [m for m in matches if m.match_type == 'EXACT']
         if exact_matches:
             return 'REJECTED'
         
@@ -400,16 +766,16 @@ class KYCScreeningTool:
             return 'REVIEW_REQUIRED'
         
         # Check for partial matches
-        partial_matches = [m for m in matches if m['match_type'] == 'PARTIAL']
+        partial_matches = [m for m in matches if m.match_type == 'PARTIAL']
         if partial_matches:
             return 'CLEAR_WITH_WARNING'
         
         return 'CLEAR'
     
-    def _save_screening_results(self, customer_data: Dict, matches: List[Dict],
+    def _save_screening_results(self, customer_data: Dict, matches: List[MatchResult],
                                risk_assessment: Dict, screening_result: str) -> str:
         """Save screening results to database"""
-        screening_id = f"SCR{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        screening_id = self._next_id('SCR')
         
         # This is a simplified version - in real implementation,
         # you would save to the database using self.db
@@ -417,7 +783,7 @@ class KYCScreeningTool:
         logger.info(f"Screening results saved with ID: {screening_id}")
         return screening_id
     
-    def _display_screening_results(self, customer_data: Dict, matches: List[Dict],
+    def _display_screening_results(self, customer_data: Dict, matches: List[MatchResult],
                                   risk_assessment: Dict, screening_result: str) -> None:
         """Display screening results to user"""
         print("\n" + "=" * 60)
@@ -438,10 +804,10 @@ class KYCScreeningTool:
             print(f"\n🚨 Sanctions Matches Found: {len(matches)}")
             for i, match in enumerate(matches[:5], 1):  # Show top 5 matches
                 print(f"\n   Match #{i}:")
-                print(f"   - Name: {match.get('sanction_name')}")
-                print(f"   - Source: {match.get('sanction_source')}")
-                print(f"   - Match Type: {match.get('match_type')}")
-                print(f"   - Confidence: {match.get('match_score', 0):.1f}%")
+                print(f"   - Name: {match.sanction_name}")
+                print(f"   - Source: {match.sanction_source}")
+                print(f"   - Match Type: {match.match_type}")
+                print(f"   - Confidence: {match.match_score:.1f}%")
         
         if risk_assessment.get('risk_factors'):
             print(f"\n⚠️  Risk Factors:")
@@ -449,12 +815,13 @@ class KYCScreeningTool:
                 print(f"   - {factor}")
     
     def _generate_screening_report(self, screening_id: str, customer_data: Dict,
-                                 matches: List[Dict], risk_assessment: Dict,
-                                 screening_result: str) -> Dict:
+                                 matches: List[MatchResult], risk_assessment: Dict,
+                                 screening_result: str,
+                                 screened_at: Optional[datetime] = None) -> Dict:
         """Generate screening report"""
         screening_data = {
             'screening_id': screening_id,
-            'screening_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'screening_date': (screened_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
             'screening_type': 'ONBOARDING',
             'risk_score': risk_assessment.get('risk_score'),
             'risk_level': risk_assessment.get('risk_level'),
@@ -467,12 +834,9 @@ class KYCScreeningTool:
             screening_data, customer_data, matches
         )
         
-        # Save report to file
+        # Save report to file (reports/ is created at startup)
         report_file = f"reports/{screening_id}_report.json"
-        os.makedirs('reports', exist_ok=True)
-        
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json_file(report, report_file)
         
         print(f"\n📄 Report generated: {report_file}")
         return report
@@ -591,11 +955,12 @@ class KYCScreeningTool:
         """Export sanctions list to CSV"""
         try:
             export_file = f"exports/sanctions_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            os.makedirs('exports', exist_ok=True)
             
-            # In real implementation, export from database
-            print(f"\n✅ Sanctions list would be exported to: {export_file}")
-            print("⚠️  This feature requires database integration.")
+            # Streamed from the database cursor, so memory use does not grow with the list
+            if self.db.export_to_csv('sanctions', export_file):
+                print(f"\n✅ Sanctions list exported to: {export_file}")
+            else:
+                print("❌ Export failed. See the log for details.")
             
         except Exception as e:
             logger.error(f"Error exporting sanctions: {e}")
@@ -605,10 +970,11 @@ class KYCScreeningTool:
         """Export screening results to CSV"""
         try:
             export_file = f"exports/screenings_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            os.makedirs('exports', exist_ok=True)
             
-            print(f"\n✅ Screening results would be exported to: {export_file}")
-            print("⚠️  This feature requires database integration.")
+            if self.db.export_to_csv('screening_results', export_file):
+                print(f"\n✅ Screening results exported to: {export_file}")
+            else:
+                print("❌ Export failed. See the log for details.")
             
         except Exception as e:
             logger.error(f"Error exporting screenings: {e}")
@@ -618,12 +984,9 @@ class KYCScreeningTool:
         """Export statistics to JSON"""
         try:
             export_file = f"exports/statistics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            os.makedirs('exports', exist_ok=True)
             
             stats = self.db.get_statistics()
-            
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, indent=2, ensure_ascii=False)
+            write_json_file(stats, export_file)
             
             print(f"\n✅ Statistics exported to: {export_file}")
             
@@ -644,7 +1007,7 @@ class KYCScreeningTool:
         print(f"Database: {config.DATABASE_CONFIG['database']}")
         print(f"High-risk Countries: {len(config.HIGH_RISK_COUNTRIES)}")
         print(f"PEP Indicators: {len(config.PEP_INDICATORS)}")
-        print(f"Name Match Threshold: {config.SCREENING_CONFIG['name_match_threshold']}%")
+        print(f"Name Match Threshold: {config.SCREENING.name_match_threshold}%")
         
         print("\n⚠️  Configuration changes require editing config.py file.")
         print("   Please restart the application after making changes.")
@@ -709,123 +1072,123 @@ class KYCScreeningTool:
         print("🆘 HELP & DOCUMENTATION")
         print("=" * 60)
         
-        help_text = f"""
-        KYC & Sanctions Screening Tool - Help Guide
-        {'=' * 50}
-        
-        Overview:
-        This tool automates customer due diligence and sanctions screening
-        for compliance with anti-money laundering (AML) regulations.
-        
-        Key Features:
-        1. Customer Screening - Screen new customers against sanctions lists
-        2. Risk Assessment - Calculate risk scores based on multiple factors
-        3. Sanctions Search - Search through sanctions databases
-        4. Reporting - Generate compliance reports
-        5. Data Export - Export screening results and statistics
-        
-        Usage Tips:
-        - Ensure customer data is accurate before screening
-        - Review all matches carefully before making decisions
-        - Export reports for compliance documentation
-        - Regularly update sanctions lists
-        
-        Configuration:
-        Edit config.py to customize:
-        - High-risk countries list
-        - PEP indicators
-        - Screening thresholds
-        - Database settings
-        
-        Support:
-        For issues or questions, contact:
-        - Email: {config.DEVELOPER_EMAIL}
-        - Phone: {config.DEVELOPER_PHONE}
-        
-        Version: {config.APP_VERSION}
-        Last Updated: {datetime.now().strftime('%Y-%m-%d')}
-        """
-        
-        print(help_text)
+        print(_HELP_TEXT.format(last_updated=datetime.now().strftime('%Y-%m-%d')))
     
     def exit_application(self) -> None:
         """Exit the application gracefully"""
-        print("\n" + "=" * 60)
-        print("🚪 EXITING APPLICATION")
-        print("=" * 60)
+        # Shown before teardown, which can take a moment to join workers
+        print(_EXIT_HEADER)
         
         try:
-            # Close database connection
-            if self.db:
-                self.db.disconnect()
-                print("✅ Database connection closed.")
+            closed = self._release_resources()
             
             # Log exit
             logger.info("Application exited gracefully.")
             
-            print(f"\nThank you for using {config.APP_NAME}!")
-            print(f"Developed by: {config.DEVELOPER_NAME}")
-            print(f"Contact: {config.DEVELOPER_EMAIL}")
-            print("\nGoodbye! 👋")
+            # The rest of the message goes out in one write
+            sys.stdout.write(("✅ Database connection closed.\n" if closed else "") + _GOODBYE + "\n")
+            sys.stdout.flush()
             
         except Exception as e:
             logger.error(f"Error during application exit: {e}")
             print(f"\n⚠️  Application exit with errors: {e}")
+    
+    def _release_resources(self) -> bool:
+        """
+        Stop the worker pool and close the database (safe to call repeatedly)
+        
+        Returns:
+            bool: True if this call closed the database connection
+        """
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        
+        if self.db and self.db.connected:
+            self.db.disconnect()
+            return True
+        return False
 
 # ==================== MAIN ENTRY POINT ====================
 
-def main():
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog='kyc_screening.py',
+        description=config.APP_NAME,
+        epilog="""
+Examples:
+  python kyc_screening.py                   # Interactive mode
+  python kyc_screening.py --batch data.csv  # Batch processing
+  python kyc_screening.py --version         # Version info
+""",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '-v', '--version', action='version',
+        version=_version_text(),
+        help='Show version information',
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', metavar='FILE', help='Process batch screening from CSV file')
+    mode.add_argument('--interactive', action='store_true', help='Run in interactive mode (default)')
+    parser.add_argument('--batch-size', type=int, default=_BATCH_SIZE, metavar='N',
+                        help=f'Most customers in flight in batch mode (default: {_BATCH_SIZE})')
+    return parser
+
+def _fatal_exit(error: Exception, app: Optional[KYCScreeningTool] = None) -> None:
+    """
+    Report a fatal error and end the process at once
+    
+    Only the audit trail is saved, by closing the database, which flushes
+    the queued audit entries. Worker threads are not joined, and os._exit
+    skips atexit hooks and interpreter finalization. A crash therefore
+    doesn't wait on in-flight screens or slow finalizers before the
+    process can be restarted.
+    
+    Args:
+        error (Exception): The error that ended the application
+        app (KYCScreeningTool): The application, if it was constructed
+    """
+    logger.error(f"Fatal application error: {error}")
+    print(f"\n❌ Fatal error: {error}")
+    try:
+        if app is not None and app.db and app.db.connected:
+            app.db.disconnect()
+    except Exception as e:
+        logger.error(f"Error closing database after fatal error: {e}")
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(1)
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point for the application"""
     
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        
-        if command == '--help' or command == '-h':
-            print(f"""
-            KYC & Sanctions Screening Tool
-            Usage: python kyc_screening.py [OPTION]
-            
-            Options:
-              --help, -h     Show this help message
-              --version, -v  Show version information
-              --batch FILE   Process batch screening from CSV file
-              --interactive  Run in interactive mode (default)
-            
-            Examples:
-              python kyc_screening.py                   # Interactive mode
-              python kyc_screening.py --batch data.csv  # Batch processing
-              python kyc_screening.py --version         # Version info
-            """)
-            return
-        
-        elif command == '--version' or command == '-v':
-            print(f"{config.APP_NAME} v{config.APP_VERSION}")
-            print(f"Developed by: {config.DEVELOPER_NAME}")
-            return
-        
-        elif command == '--batch' and len(sys.argv) > 2:
-            csv_file = sys.argv[2]
-            print(f"Batch processing from: {csv_file}")
-            print("⚠️  Batch processing requires additional implementation.")
-            return
-        
-        elif command == '--interactive':
-            pass  # Continue with interactive mode
-        
-        else:
-            print(f"Unknown option: {command}")
-            print("Use --help for available options.")
-            return
+    # --help and --version print and exit inside parse_args
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    
+    app = None
+    if args.batch:
+        try:
+            app = KYCScreeningTool()
+            screened = app.run_batch(args.batch, args.batch_size)
+            app.exit_application()
+        except Exception as e:
+            _fatal_exit(e, app)
+        if not screened:
+            sys.exit(1)
+        return
     
     # Run interactive application
     try:
         app = KYCScreeningTool()
         app.run()
     except Exception as e:
-        logger.error(f"Fatal application error: {e}")
-        print(f"\n❌ Fatal error: {e}")
-        sys.exit(1)
+        _fatal_exit(e, app)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
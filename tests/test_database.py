@@ -0,0 +1,82 @@
+"""
+Tests for KYCDatabase sanctions loading
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import KYCDatabase, _CSV_BUFFER_SIZE
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Runs each test against a fresh database in a temporary directory"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)  # Keep any logs or exports out of the repo
+        self.addCleanup(os.chdir, cwd)
+        
+        self.db = KYCDatabase(os.path.join(self.tmp.name, 'kyc_test.db'))
+        self.assertTrue(self.db.connect())
+        self.addCleanup(self.db.disconnect)
+        self.assertTrue(self.db.initialize_database())
+        
+        self.csv_path = os.path.join(self.tmp.name, 'sanctions.csv')
+
+
+class LoadSanctionsCsvTest(DatabaseTestCase):
+    """Header-driven column mapping in load_sanctions_csv"""
+    
+    def test_surplus_fields_do_not_fill_missing_columns(self):
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write('full_name_en,list_source\r\nEvil Person,OFAC,EXTRA\r\n')
+        
+        self.assertTrue(self.db.load_sanctions_csv(self.csv_path))
+        row = self.db.conn.execute(
+            "SELECT list_source, list_type, nationality_code FROM sanctions WHERE full_name_en = ?",
+            ('Evil Person',)).fetchone()
+        self.assertEqual(tuple(row), ('OFAC', None, None))
+
+
+class BulkLoadFailureTest(DatabaseTestCase):
+    """A failed sanctions load must not leave the writer inside a transaction"""
+    
+    def setUp(self):
+        super().setUp()
+        with open(self.csv_path, 'wb') as f:
+            f.write(b'full_name_en,list_source\r\n')
+            # Past the reader's buffer, so decoding fails mid-load rather
+            # than while the header is read
+            row = b'John Doe,OFAC\r\n'
+            f.write(row * (_CSV_BUFFER_SIZE // len(row) + 1))
+            f.write(b'Bad \xff Name,UN\r\n')
+    
+    def _assert_still_writable(self):
+        success, message = self.db.add_customer({
+            'customer_code': 'CUST0001',
+            'full_name_en': 'Jane Roe',
+            'nationality_code': 'EG',
+            'id_type': 'NATIONAL_ID',
+            'id_number': '29001011234567',
+        })
+        self.assertTrue(success, message)
+    
+    def test_undecodable_csv(self):
+        self.assertFalse(self.db.load_sanctions_csv(self.csv_path))
+        self.assertFalse(self.db.conn.in_transaction)
+        self._assert_still_writable()
+    
+    def test_undecodable_csv_initial_load(self):
+        self.assertFalse(self.db.load_sanctions_csv(self.csv_path, initial_load=True))
+        self.assertFalse(self.db.conn.in_transaction)
+        self._assert_still_writable()
+
+
+if __name__ == '__main__':
+    unittest.main()
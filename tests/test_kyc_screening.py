@@ -0,0 +1,123 @@
+"""
+Tests for KYCScreeningTool batch screening
+"""
+
+import contextlib
+import csv
+import importlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CSV_HEADER = 'customer_code,full_name_en,nationality_code,id_type,id_number\r\n'
+
+# Valid customers; the second is on the sample sanctions list
+CUSTOMER_ROWS = [
+    'C1,John Smith,GB,PASSPORT,A1000001\r\n',
+    'C2,Ahmed Ali Al-Masri,EG,PASSPORT,A1000002\r\n',
+    'C3,Maria Garcia,ES,PASSPORT,A1000003\r\n',
+    'C4,Li Wei,CN,PASSPORT,A1000004\r\n',
+    'C5,Anna Schmidt,DE,PASSPORT,A1000005\r\n',
+]
+
+
+class BatchScreeningTest(unittest.TestCase):
+    """screen_batch, screen_csv_file and run_batch"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.cwd = os.getcwd()
+        # The tool creates its database, logs and exports in the working directory
+        os.chdir(cls.tmp.name)
+        kyc_screening = importlib.import_module('kyc_screening')
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.app = kyc_screening.KYCScreeningTool()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.app._release_resources()
+        os.chdir(cls.cwd)
+        cls.tmp.cleanup()
+    
+    def _write_csv(self, *rows):
+        path = os.path.join(self.tmp.name, 'customers.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(CSV_HEADER + ''.join(rows))
+        return path
+    
+    def _read_export(self, path):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            return list(csv.DictReader(f))
+    
+    def test_screen_batch_preserves_order(self):
+        customers = [dict(zip(CSV_HEADER.strip().split(','), row.strip().split(',')))
+                     for row in CUSTOMER_ROWS]
+        results = self.app.screen_batch(customers)
+        self.assertEqual([r['customer_code'] for r in results], ['C1', 'C2', 'C3', 'C4', 'C5'])
+        self.assertEqual(results[1]['screening_result'], 'REJECTED')
+    
+    def test_csv_export_preserves_order(self):
+        output = os.path.join(self.tmp.name, 'order.csv')
+        # More rows than batch_size, so results are written while rows are still read
+        self.app.screen_csv_file(self._write_csv(*CUSTOMER_ROWS), output, batch_size=2)
+        self.assertEqual([r['customer_code'] for r in self._read_export(output)],
+                         ['C1', 'C2', 'C3', 'C4', 'C5'])
+    
+    def test_csv_blank_lines_are_skipped(self):
+        output = os.path.join(self.tmp.name, 'blank.csv')
+        summary = self.app.screen_csv_file(
+            self._write_csv(CUSTOMER_ROWS[0], '\r\n', CUSTOMER_ROWS[2], '\r\n\r\n'), output)
+        self.assertEqual(sum(summary.values()), 2)
+        self.assertEqual([r['customer_code'] for r in self._read_export(output)], ['C1', 'C3'])
+    
+    def test_csv_summary_counts(self):
+        output = os.path.join(self.tmp.name, 'summary.csv')
+        summary = self.app.screen_csv_file(
+            self._write_csv(*CUSTOMER_ROWS, 'C6,,XX,PASSPORT,A1000006\r\n'), output)
+        self.assertEqual(summary, {'CLEAR': 4, 'REJECTED': 1, 'INVALID': 1})
+        
+        exported = {}
+        for row in self._read_export(output):
+            exported[row['screening_result']] = exported.get(row['screening_result'], 0) + 1
+        self.assertEqual(exported, summary)
+    
+    def test_invalid_rows_are_never_cleared(self):
+        output = os.path.join(self.tmp.name, 'invalid.csv')
+        self.app.screen_csv_file(self._write_csv('C7,,XX,PASSPORT,A1000007\r\n'), output)
+        row, = self._read_export(output)
+        self.assertEqual(row['screening_result'], 'INVALID')
+        self.assertIn('full_name_en', row['errors'])
+    
+    def test_failed_run_leaves_no_partial_export(self):
+        output = os.path.join(self.tmp.name, 'failed.csv')
+        csv_customer = self.app._csv_customer
+        
+        def fail_on_third(header, row):
+            if row[0] == 'C3':
+                raise RuntimeError('unreadable row')
+            return csv_customer(header, row)
+        
+        self.app._csv_customer = fail_on_third
+        try:
+            with self.assertRaises(RuntimeError):
+                self.app.screen_csv_file(self._write_csv(*CUSTOMER_ROWS), output)
+        finally:
+            del self.app._csv_customer
+        self.assertFalse(os.path.exists(output))
+        self.assertFalse(os.path.exists(output + '.part'))
+    
+    def test_run_batch_reports_unreadable_file(self):
+        path = os.path.join(self.tmp.name, 'latin1.csv')
+        with open(path, 'wb') as f:
+            f.write(CSV_HEADER.encode() + b'C1,Jos\xe9 P\xe9rez,ES,PASSPORT,A1000001\r\n')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(self.app.run_batch(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
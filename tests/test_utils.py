@@ -0,0 +1,115 @@
+"""
+Tests for the batch helpers in utils, checked against their scalar counterparts
+"""
+
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from utils import DateUtils, MatchResult, RiskCalculator
+
+
+class CalculateAgesBatchTest(unittest.TestCase):
+    """DateUtils.calculate_ages_batch must agree with calculate_age"""
+    
+    def test_matches_calculate_age(self):
+        today = date.today()
+        birth_dates = [
+            '1980-05-15', '2000-02-29', '1980-1-5', '1999-12-31',
+            today.replace(year=today.year - 30).isoformat(),  # Birthday today
+            (today + timedelta(days=1)).replace(year=today.year - 30).isoformat(),
+            (today + timedelta(days=30)).isoformat(),  # Not born yet
+            date(1975, 7, 1), datetime(1990, 3, 4, 12, 30),
+            # Malformed or invalid
+            '1980-13-45', '2001-02-29', '15/05/1980', 'bad', ' 1980-05-15', '', None,
+        ]
+        
+        batch = DateUtils.calculate_ages_batch(birth_dates)
+        self.assertEqual(len(batch), len(birth_dates))
+        for birth_date, age in zip(birth_dates, batch):
+            expected = DateUtils.calculate_age(birth_date)
+            actual = None if pd.isna(age) else int(age)
+            self.assertEqual(actual, expected, f"birth date {birth_date!r}")
+
+
+
+def _match(match_type):
+    return MatchResult(True, 1, 'Name', 'UN', match_type, 90.0, 90.0, False, False, 'HIGH')
+
+
+# Customers spanning each risk factor, the score cap and every risk level
+RISK_CUSTOMERS = [
+    ({'nationality_code': 'GB', 'id_number': 'A1234567'}, []),
+    ({'nationality_code': 'IR', 'id_number': 'A1234567'}, []),
+    ({'nationality_code': 'PK', 'occupation': 'Deputy Minister', 'id_number': 'A1234567'}, []),
+    ({'nationality_code': 'EG', 'date_of_birth': '1940-01-01', 'id_number': 'A1234567'}, []),
+    ({'nationality_code': 'EG', 'date_of_birth': 'bad', 'id_number': '000000'}, []),
+    ({'nationality_code': 'EG', 'id_number': '1212121'}, [_match('PARTIAL')]),
+    ({'nationality_code': 'SY', 'occupation': 'Teacher', 'id_number': 'A1234567'},
+     [_match('PARTIAL'), _match('NO_MATCH')]),
+    ({'nationality_code': 'KP', 'occupation': 'General', 'id_number': 'A1234567'}, [_match('EXACT')]),
+    ({'nationality_code': 'ir', 'occupation': '', 'id_number': ''}, []),
+    ({}, []),
+]
+
+
+class ScoreBatchTest(unittest.TestCase):
+    """RiskCalculator.score_batch must agree with calculate_customer_risk"""
+    
+    def test_matches_calculate_customer_risk(self):
+        calculator = RiskCalculator(config)
+        threshold = config.RISK_SCORING['age_risk_threshold']
+        features = {name: [] for name in ('pep', 'country', 'exact', 'partial', 'age', 'suspicious', 'zero')}
+        for customer, matches in RISK_CUSTOMERS:
+            occupation = (customer.get('occupation') or '').lower()
+            id_number = customer.get('id_number', '')
+            age = DateUtils.calculate_age(customer['date_of_birth']) if customer.get('date_of_birth') else None
+            tier = config.COUNTRY_RISK_TIER.get(customer.get('nationality_code', ''), 0)
+            features['pep'].append(bool(occupation) and config.PEP_MATCHER(occupation))
+            features['country'].append(config.COUNTRY_TIER_PENALTY[tier])
+            features['exact'].append(sum(m.match_type == 'EXACT' for m in matches))
+            features['partial'].append(sum(m.match_type != 'EXACT' for m in matches))
+            features['age'].append(bool(age) and age > threshold)
+            features['suspicious'].append(bool(id_number) and len(set(id_number)) <= 3)
+            features['zero'].append(bool(id_number) and not id_number.strip('0'))
+        
+        scores, levels = calculator.score_batch(
+            features['pep'], features['country'], features['exact'], features['partial'],
+            features['age'], features['suspicious'], features['zero'])
+        
+        expected = [calculator.calculate_customer_risk(customer, matches)
+                    for customer, matches in RISK_CUSTOMERS]
+        self.assertEqual([int(score) for score in scores], [e['risk_score'] for e in expected])
+        self.assertEqual([str(level) for level in levels], [e['risk_level'] for e in expected])
+        # The sample should reach every risk level
+        self.assertEqual(set(levels), {'VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'})
+
+
+
+class CountryPenaltiesBatchTest(unittest.TestCase):
+    """RiskCalculator.country_penalties_batch must agree with the per-customer tier lookup"""
+    
+    def test_matches_country_risk_tier(self):
+        calculator = RiskCalculator(config)
+        codes = [
+            *config.HIGH_RISK_COUNTRIES, *config.MEDIUM_RISK_COUNTRIES, 'EG', 'GB', 'ZZ', 'AA',
+            # Malformed: wrong case, length or characters, and non-strings
+            'ir', 'Ir', 'I', 'IRN', 'I1', '1R', '', ' I', 'ÄB', 'IR\x00', None, 42,
+        ]
+        
+        penalties = calculator.country_penalties_batch(codes)
+        for code, penalty in zip(codes, penalties.tolist()):
+            tier = config.COUNTRY_RISK_TIER.get(code, 0)
+            self.assertEqual(penalty, config.COUNTRY_TIER_PENALTY[tier], f"code {code!r}")
+        self.assertEqual(len(penalties), len(codes))
+        self.assertEqual(len(calculator.country_penalties_batch([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,18 +7,187 @@ Version: 1.0.0
 import re
 import unicodedata
 import json
+import threading
+from bisect import bisect_right
 from datetime import datetime, date, timedelta
-from difflib import SequenceMatcher
-from typing import Dict, List, Tuple, Optional, Any, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional, Any, Union
 import logging
 import config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional: falls back to Numba, then (cy)difflib
+    fuzz = process = None
+
+try:
+    from cydifflib import SequenceMatcher
+except ImportError:  # Optional: C build of difflib's matcher, same results
+    from difflib import SequenceMatcher
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the json module
+    orjson = None
+
+# NumPy is only needed by the Numba kernel, so it is not imported otherwise
+njit = None
+if fuzz is None:
+    try:
+        from numba import njit, types
+        import numpy as np
+    except ImportError:
+        njit = None
+
 logger = logging.getLogger(__name__)
 
+# ==================== SIMILARITY KERNEL ====================
+# Only compiled when RapidFuzz is missing. Computes the same score as
+# rapidfuzz.fuzz.ratio (normalised indel similarity, i.e. twice the longest
+# common subsequence over the combined length) on code point arrays, with a
+# two-row DP. The explicit signature compiles it eagerly at import rather
+# than on the first screening, and cache=True keeps the machine code on
+# disk, so after the first run the import just loads it back.
+if fuzz is None and njit is not None:
+    # _code_points returns read-only views over the encoded bytes
+    _CODE_POINTS_TYPE = types.Array(types.int32, 1, 'C', readonly=True)
+    
+    @njit(types.float64(_CODE_POINTS_TYPE, _CODE_POINTS_TYPE), cache=True, fastmath=True)
+    def _lcs_ratio(a, b):
+        n = len(b)
+        prev = np.zeros(n + 1, np.int32)
+        cur = np.zeros(n + 1, np.int32)
+        for i in range(len(a)):
+            ai = a[i]
+            for j in range(n):
+                if ai == b[j]:
+                    cur[j + 1] = prev[j] + 1
+                else:
+                    cur[j + 1] = max(prev[j + 1], cur[j])
+            prev, cur = cur, prev
+        return 200.0 * prev[n] / (len(a) + n)
+    
+    @lru_cache(maxsize=4096)
+    def _code_points(text: str):
+        """Code points of a string as an int32 array, converted once per string"""
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.int32)
+else:
+    _lcs_ratio = None
+
 # ==================== STRING UTILITIES ====================
 
+# Customer names, aliases and search terms recur across screens, batch rows
+# and searches, so normalised forms are memoised. Only str arguments reach
+# these; StringUtils filters out everything else first.
+_NORMALIZE_CACHE_SIZE = 100_000
+
+class _ArabicFoldTable(dict):
+    """
+    str.translate table for _normalize_arabic
+    
+    Seeded with the Arabic letter variants (folded to their standard forms),
+    the diacritics and tatweel (removed). Any other code point is looked up
+    once, on first sight: combining marks map to None, everything else to
+    itself. The table therefore only ever holds the characters seen so far.
+    """
+    
+    def __missing__(self, code: int):
+        value = None if unicodedata.combining(chr(code)) else code
+        self[code] = value
+        return value
+
+_ARABIC_FOLD = _ArabicFoldTable({
+    **dict.fromkeys(range(0x064B, 0x0660)),  # Diacritics (harakat)
+    0x0670: None,                            # Superscript alef
+    0x0640: None,                            # Tatweel
+    **{ord(old): new for old, new in (
+        ('آ', 'ا'), ('أ', 'ا'), ('إ', 'ا'), ('ى', 'ي'),
+        ('ة', 'ه'), ('ؤ', 'و'), ('ئ', 'ي'),
+    )},
+})
+
+# Compiled once here rather than looked up in re's cache on every call
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Common titles and honorifics, removed in a single pass
+_TITLES_RE = re.compile(
+    r'\b(?:mr|mrs|ms|miss|dr|prof|eng|sir|madam|lord|lady|haj|sheikh)\b\.?\s*'
+)
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_arabic(text: str) -> str:
+    """Cached body of StringUtils.normalize_arabic"""
+    try:
+        # Decompose, then drop combining marks, fold letter variants and
+        # remove diacritics and tatweel in one C-level pass
+        text = unicodedata.normalize('NFKD', text).translate(_ARABIC_FOLD)
+        
+        # Remove extra whitespace
+        text = ' '.join(text.split())
+        
+        return text.strip()
+    
+    except Exception as e:
+        logger.error(f"Error normalizing Arabic text: {e}")
+        return text.strip() if text else ""
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_english(text: str) -> str:
+    """Cached body of StringUtils.normalize_english"""
+    try:
+        # Convert to lowercase
+        text = text.lower().strip()
+        
+        # Remove common titles and honorifics
+        text = _TITLES_RE.sub('', text)
+        
+        # Remove punctuation and special characters
+        text = _PUNCTUATION_RE.sub(' ', text)
+        
+        # Remove extra whitespace
+        text = ' '.join(text.split())
+        
+        return text
+    
+    except Exception as e:
+        logger.error(f"Error normalizing English text: {e}")
+        return text.strip() if text else ""
+
+# Without RapidFuzz, name_similarity token-sorts both names on every call.
+# Each sanction name meets every customer screened, so its sorted form is
+# memoised rather than re-split and re-sorted per pair.
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _presort_tokens(text: str) -> str:
+    """The words of text in sorted order, joined by single spaces"""
+    return ' '.join(sorted(text.split()))
+
+# SequenceMatcher indexes its second sequence (b2j) when it is set, and the
+# index can be reused for any number of first sequences. In screening the
+# second sequence is the sanction name, which recurs for every customer, so
+# the difflib fallback keeps one matcher per name. Matchers are mutable, so
+# each thread has its own set; a set is dropped once it reaches the limit.
+_MATCHER_CACHE_SIZE = 20_000
+_matchers = threading.local()
+
+def _difflib_ratio(str1: str, str2: str) -> float:
+    """SequenceMatcher(None, str1, str2).ratio() * 100, reusing str2's index"""
+    cache = getattr(_matchers, 'by_seq2', None)
+    if cache is None:
+        cache = _matchers.by_seq2 = {}
+    matcher = cache.get(str2)
+    if matcher is None:
+        if len(cache) >= _MATCHER_CACHE_SIZE:
+            cache.clear()
+        matcher = cache[str2] = SequenceMatcher(None, '', str2)
+    matcher.set_seq1(str1)
+    return matcher.ratio() * 100
+
+# Matchers for caller-supplied indicator lists, compiled once per list
+@lru_cache(maxsize=32)
+def _indicator_matcher(indicators: Tuple[str, ...]):
+    """config.compile_substring_matcher, memoised per indicator tuple"""
+    return config.compile_substring_matcher(indicators)
+
 class StringUtils:
     """Utilities for string manipulation and comparison"""
     
@@ -36,37 +205,7 @@ class StringUtils:
         if not text or not isinstance(text, str):
             return ""
         
-        try:
-            # Normalize Unicode characters
-            text = unicodedata.normalize('NFKD', text)
-            text = ''.join([c for c in text if not unicodedata.combining(c)])
-            
-            # Replace Arabic variations with standard forms
-            replacements = {
-                'آ': 'ا',
-                'أ': 'ا',
-                'إ': 'ا',
-                'ى': 'ي',
-                'ة': 'ه',
-                'ؤ': 'و',
-                'ئ': 'ي',
-            }
-            
-            for old, new in replacements.items():
-                text = text.replace(old, new)
-            
-            # Remove diacritics and tatweel
-            text = re.sub(r'[\u064B-\u065F\u0670]', '', text)
-            text = text.replace('ـ', '')
-            
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error normalizing Arabic text: {e}")
-            return text.strip() if text else ""
+        return _normalize_arabic(text)
     
     @staticmethod
     def normalize_english(text: str) -> str:
@@ -82,57 +221,169 @@ class StringUtils:
         if not text or not isinstance(text, str):
             return ""
         
-        try:
-            # Convert to lowercase
-            text = text.lower().strip()
-            
-            # Remove common titles and honorifics
-            titles = ['mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'eng', 
-                     'sir', 'madam', 'lord', 'lady', 'haj', 'sheikh']
-            
-            for title in titles:
-                text = re.sub(rf'\b{title}\b\.?\s*', '', text)
-            
-            # Remove punctuation and special characters
-            text = re.sub(r'[^\w\s]', ' ', text)
-            
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            
-            return text
-            
-        except Exception as e:
-            logger.error(f"Error normalizing English text: {e}")
-            return text.strip() if text else ""
+        return _normalize_english(text)
+    
+    @staticmethod
+    def normalize_english_batch(texts: Iterable[str]) -> List[str]:
+        """
+        Apply normalize_english to many texts, e.g. a column of names being loaded
+        
+        Bypasses the memo cache, which is sized for recurring customer names;
+        a bulk load of mostly unique names would only evict those entries.
+        
+        Args:
+            texts (iterable): English texts to normalize
+        
+        Returns:
+            list: Normalized texts, in order
+        """
+        normalize = _normalize_english.__wrapped__
+        return [normalize(text) if text and isinstance(text, str) else "" for text in texts]
     
     @staticmethod
-    def similarity_ratio(str1: str, str2: str) -> float:
+    def normalize_arabic_batch(texts: Iterable[str]) -> List[str]:
+        """
+        Apply normalize_arabic to many texts, bypassing the memo cache
+        
+        Args:
+            texts (iterable): Arabic texts to normalize
+        
+        Returns:
+            list: Normalized texts, in order
+        """
+        normalize = _normalize_arabic.__wrapped__
+        return [normalize(text) if text and isinstance(text, str) else "" for text in texts]
+    
+    @staticmethod
+    def similarity_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
         """
         Calculate similarity ratio between two strings
         
         Args:
             str1 (str): First string
             str2 (str): Second string
+            score_cutoff (float): Ratios below this are returned as 0, which
+                lets RapidFuzz stop comparing early (0-100)
         
         Returns:
             float: Similarity ratio (0-100)
         """
         if not str1 or not str2:
             return 0.0
+        if str1 == str2:
+            return 100.0
         
         try:
-            # Use SequenceMatcher for accurate similarity calculation
-            return SequenceMatcher(None, str(str1), str(str2)).ratio() * 100
+            if fuzz is not None:
+                return fuzz.ratio(str(str1), str(str2), score_cutoff=score_cutoff)
+            if _lcs_ratio is not None:
+                score = _lcs_ratio(_code_points(str(str1)), _code_points(str(str2)))
+            else:
+                # Use SequenceMatcher for accurate similarity calculation
+                score = _difflib_ratio(str(str1), str(str2))
+            return score if score >= score_cutoff else 0.0
             
         except Exception as e:
             logger.error(f"Error calculating similarity ratio: {e}")
             return 0.0
     
+    @staticmethod
+    def name_similarity(name1: str, name2: str) -> float:
+        """
+        Calculate the similarity of two normalised names, tolerating reordered words
+        
+        Uses RapidFuzz's WRatio when installed, otherwise the better of the
+        plain and token-sorted similarity ratios.
+        
+        Args:
+            name1 (str): First name
+            name2 (str): Second name
+        
+        Returns:
+            float: Similarity score (0-100)
+        """
+        if not name1 or not name2:
+            return 0.0
+        if fuzz is not None:
+            return fuzz.WRatio(name1, name2)
+        return max(StringUtils.similarity_ratio(name1, name2),
+                   StringUtils._token_sort_ratio(name1, name2))
+    
+    @staticmethod
+    def batch_name_similarity(query: str, choices: List[str], score_cutoff: float = 0.0,
+                              workers: int = -1) -> List[float]:
+        """
+        Calculate name_similarity between one name and many
+        
+        With RapidFuzz installed all pairs are scored in one process.cdist
+        call, which abandons a comparison once it cannot reach score_cutoff.
+        
+        Args:
+            query (str): Name to compare
+            choices (list): Names to compare it against
+            score_cutoff (float): Scores below this are returned as 0 (0-100)
+            workers (int): RapidFuzz scoring threads (-1 for one per CPU); pass 1
+                when the caller already runs in a thread pool
+        
+        Returns:
+            list: Similarity score (0-100) per choice, in order
+        """
+        if not query or not choices:
+            return [0.0] * len(choices)
+        
+        if process is not None:
+            scores = process.cdist([query], choices, scorer=fuzz.WRatio,
+                                   score_cutoff=score_cutoff, workers=workers)[0]
+            # Empty choices score 0, as in name_similarity
+            return [float(score) if choice else 0.0 for score, choice in zip(scores, choices)]
+        
+        scores = []
+        for choice in choices:
+            score = StringUtils.name_similarity(query, choice)
+            scores.append(score if score >= score_cutoff else 0.0)
+        return scores
+    
+    @staticmethod
+    def fuzzy_match_batch(query: str, candidates: List[str],
+                          threshold: float = 85.0) -> List[Tuple[int, float]]:
+        """
+        Find the candidates whose name_similarity to a name reaches a threshold
+        
+        With RapidFuzz installed this is a single process.extract call, which
+        scores every candidate in C++ and skips those that cannot reach the
+        threshold.
+        
+        Args:
+            query (str): Normalised name to look up
+            candidates (list): Normalised names to compare it against
+            threshold (float): Minimum score to report (0-100)
+        
+        Returns:
+            list: (candidate index, score) pairs, best match first
+        """
+        if not query or not candidates:
+            return []
+        
+        if process is not None:
+            return [(index, score) for _, score, index in
+                    process.extract(query, candidates, scorer=fuzz.WRatio,
+                                    score_cutoff=threshold, limit=None)]
+        
+        scores = StringUtils.batch_name_similarity(query, candidates, threshold)
+        matches = [(index, score) for index, score in enumerate(scores)
+                   if score and score >= threshold]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+    
     @staticmethod
     def fuzzy_match_names(name1: str, name2: str, threshold: float = 85.0) -> Tuple[bool, float]:
         """
         Perform fuzzy matching between two names
         
+        The score is the best of the plain, partial and token-sorted ratios.
+        Scores below the threshold are cut off (see similarity_ratio), so a
+        non-match reports a score of 0.
+        
         Args:
             name1 (str): First name
             name2 (str): Second name
@@ -148,45 +399,63 @@ class StringUtils:
         norm1 = StringUtils.normalize_english(name1)
         norm2 = StringUtils.normalize_english(name2)
         
-        # Calculate multiple similarity metrics
-        ratio = StringUtils.similarity_ratio(norm1, norm2)
-        partial_ratio = StringUtils._partial_ratio(norm1, norm2)
-        token_sort_ratio = StringUtils._token_sort_ratio(norm1, norm2)
+        len1, len2 = len(norm1), len(norm2)
+        if not len1 or not len2:
+            return False, 0.0
         
-        # Use the highest score
-        match_score = max(ratio, partial_ratio, token_sort_ratio)
+        # Calculate multiple similarity metrics
+        scorers = [StringUtils.similarity_ratio]
+        
+        # The plain and token-sorted ratios compare strings of these same
+        # lengths, so neither can exceed 200 * shorter / combined length
+        if 200 * min(len1, len2) < threshold * (len1 + len2):
+            scorers.clear()
+        elif ' ' in norm1 or ' ' in norm2:
+            # Sorting a single word changes nothing
+            scorers.append(StringUtils._token_sort_ratio)
+        scorers.append(StringUtils._partial_ratio)
+        
+        # Use the highest score. Only a score beating both the threshold and
+        # the best so far can matter, so each scorer gets that as its cutoff
+        # and RapidFuzz can abandon the comparison as soon as it falls short.
+        match_score = 0.0
+        for scorer in scorers:
+            match_score = max(match_score,
+                              scorer(norm1, norm2, score_cutoff=max(threshold, match_score)))
         is_match = match_score >= threshold
         
         return is_match, match_score
     
     @staticmethod
-    def _partial_ratio(str1: str, str2: str) -> float:
+    def _partial_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
         """Calculate partial ratio for fuzzy matching"""
+        if fuzz is not None:
+            return fuzz.partial_ratio(str1, str2, score_cutoff=score_cutoff)
+        
+        # Slide the shorter string along the longer one
         if len(str1) <= len(str2):
             shorter, longer = str1, str2
         else:
             shorter, longer = str2, str1
         
-        m = len(shorter)
-        scores = []
-        
-        for i in range(len(longer) - m + 1):
-            substring = longer[i:i + m]
-            score = StringUtils.similarity_ratio(shorter, substring)
-            scores.append(score)
+        # An exact window scores 100, and `in` finds one without scoring each
+        if shorter and shorter in longer:
+            return 100.0
         
-        return max(scores) if scores else 0.0
+        # Repeated windows (common in names: "al", "abd", doubled letters)
+        # are scored once
+        m = len(shorter)
+        windows = {longer[i:i + m] for i in range(len(longer) - m + 1)}
+        score = max((StringUtils.similarity_ratio(shorter, window) for window in windows), default=0.0)
+        return score if score >= score_cutoff else 0.0
     
     @staticmethod
-    def _token_sort_ratio(str1: str, str2: str) -> float:
+    def _token_sort_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
         """Calculate token sort ratio for fuzzy matching"""
-        tokens1 = sorted(str1.split())
-        tokens2 = sorted(str2.split())
-        
-        sorted1 = ' '.join(tokens1)
-        sorted2 = ' '.join(tokens2)
+        if fuzz is not None:
+            return fuzz.token_sort_ratio(str1, str2, score_cutoff=score_cutoff)
         
-        return StringUtils.similarity_ratio(sorted1, sorted2)
+        return StringUtils.similarity_ratio(_presort_tokens(str1), _presort_tokens(str2), score_cutoff)
     
     @staticmethod
     def extract_names(full_name: str) -> Tuple[str, str]:
@@ -218,7 +487,8 @@ class StringUtils:
         
         Args:
             text (str): Text to check
-            indicators (list): List of PEP indicators
+            indicators (list): List of PEP indicators (defaults to the
+                precompiled config.PEP_MATCHER)
         
         Returns:
             bool: True if PEP indicator found
@@ -226,17 +496,33 @@ class StringUtils:
         if not text:
             return False
         
-        indicators = indicators or config.PEP_INDICATORS
         text_lower = text.lower()
-        
-        for indicator in indicators:
-            if indicator in text_lower:
-                return True
-        
-        return False
+        if not indicators:
+            return config.PEP_MATCHER(text_lower)
+        return _indicator_matcher(tuple(indicators))(text_lower)
 
 # ==================== DATE UTILITIES ====================
 
+# The same few dates of birth are validated and aged over and over (form
+# input, batch rows, risk scoring), so parse results are memoised
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str, date_format: str = '%Y-%m-%d') -> Optional[date]:
+    """Parse a date string, or return None if it does not match the format"""
+    try:
+        # Zero-padded ISO dates take the C parser; strptime also accepts
+        # unpadded fields, so anything else still goes through it
+        if date_format == '%Y-%m-%d' and len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
+        return datetime.strptime(date_str, date_format).date()
+    except (ValueError, TypeError):
+        return None
+
+# Input formats format_date recognises, tried in order
+_DATE_INPUT_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d')
+
 class DateUtils:
     """Utilities for date manipulation and validation"""
     
@@ -257,24 +543,48 @@ class DateUtils:
         try:
             # Convert string to date if necessary
             if isinstance(birth_date, str):
-                birth_date = datetime.strptime(birth_date, '%Y-%m-%d').date()
+                parsed = _parse_date(birth_date)
+                if parsed is None:
+                    raise ValueError(f"invalid date {birth_date!r}")
+                birth_date = parsed
             
             if not isinstance(birth_date, date):
                 return None
             
+            # Dates as YYYYMMDD integers: the difference in whole 10000s is
+            # the age, already one less if this year's birthday is still ahead
             today = date.today()
-            age = today.year - birth_date.year
-            
-            # Adjust if birthday hasn't occurred yet this year
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
-            
-            return age
+            today_key = today.year * 10000 + today.month * 100 + today.day
+            birth_key = birth_date.year * 10000 + birth_date.month * 100 + birth_date.day
+            return (today_key - birth_key) // 10000
             
         except (ValueError, TypeError) as e:
             logger.error(f"Error calculating age: {e}")
             return None
     
+    @staticmethod
+    def calculate_ages_batch(birth_dates: Iterable) -> 'pd.Series':
+        """
+        Calculate ages for many birth dates at once, e.g. a customer column
+        
+        Same arithmetic as calculate_age, done as whole-column integer
+        operations instead of a Python call per row.
+        
+        Args:
+            birth_dates (iterable): Dates of birth (YYYY-MM-DD strings or dates)
+        
+        Returns:
+            pd.Series: Ages in years (nullable Int64, <NA> where invalid)
+        """
+        import pandas as pd
+        
+        dobs = pd.to_datetime(pd.Series(birth_dates, dtype=object),
+                              format='%Y-%m-%d', errors='coerce')
+        today = date.today()
+        today_key = today.year * 10000 + today.month * 100 + today.day
+        birth_keys = dobs.dt.year * 10000 + dobs.dt.month * 100 + dobs.dt.day
+        return ((today_key - birth_keys) // 10000).astype('Int64')
+    
     @staticmethod
     def is_date_valid(date_str: str, date_format: str = '%Y-%m-%d') -> bool:
         """
@@ -290,11 +600,7 @@ class DateUtils:
         if not date_str:
             return False
         
-        try:
-            datetime.strptime(date_str, date_format)
-            return True
-        except ValueError:
-            return False
+        return _parse_date(date_str, date_format) is not None
     
     @staticmethod
     def format_date(date_obj: Union[str, datetime, date], 
@@ -315,12 +621,11 @@ class DateUtils:
         try:
             # Convert string to datetime if necessary
             if isinstance(date_obj, str):
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d']:
-                    try:
-                        date_obj = datetime.strptime(date_obj, fmt)
+                for fmt in _DATE_INPUT_FORMATS:
+                    parsed = _parse_date(date_obj, fmt)
+                    if parsed is not None:
+                        date_obj = parsed
                         break
-                    except ValueError:
-                        continue
                 else:
                     return date_obj  # Return original if cannot parse
             
@@ -350,9 +655,9 @@ class DateUtils:
         try:
             # Convert strings to dates if necessary
             if isinstance(date1, str):
-                date1 = datetime.strptime(date1, '%Y-%m-%d').date()
+                date1 = _parse_date(date1)
             if isinstance(date2, str):
-                date2 = datetime.strptime(date2, '%Y-%m-%d').date()
+                date2 = _parse_date(date2)
             
             if not isinstance(date1, date) or not isinstance(date2, date):
                 return None
@@ -365,6 +670,11 @@ class DateUtils:
 
 # ==================== VALIDATION UTILITIES ====================
 
+_NATIONAL_ID_RE = re.compile(r'\d{14}')
+_PASSPORT_RE = re.compile(r'[A-Za-z][A-Za-z0-9]*')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 class ValidationUtils:
     """Utilities for data validation"""
     
@@ -387,23 +697,18 @@ class ValidationUtils:
         
         if id_type.upper() == 'NATIONAL_ID':
             # Egyptian National ID validation
-            if len(id_number) != 14 or not id_number.isdigit():
+            if len(id_number) != 14 or not _NATIONAL_ID_RE.fullmatch(id_number):
                 return False, "Egyptian National ID must be 14 digits"
             
-            # Validate century code
-            century_code = int(id_number[0])
-            if century_code not in [2, 3]:
+            # Leading CYYMMDD block: parse once and split arithmetically
+            century_code, birth = divmod(int(id_number[:7]), 1000000)
+            if century_code not in (2, 3):
                 return False, "Invalid century code in Egyptian National ID"
             
-            # Validate birth date
-            year = int(id_number[1:3])
-            month = int(id_number[3:5])
-            day = int(id_number[5:7])
-            
-            if century_code == 2:
-                year += 1900
-            else:  # century_code == 3
-                year += 2000
+            # Validate birth date (century code 2 -> 1900s, 3 -> 2000s)
+            year, month_day = divmod(birth, 10000)
+            month, day = divmod(month_day, 100)
+            year += 1700 + century_code * 100
             
             try:
                 datetime(year, month, day)
@@ -418,7 +723,7 @@ class ValidationUtils:
                 return False, "Passport number must be at least 6 characters"
             
             # Basic format check (letter followed by digits)
-            if not re.match(r'^[A-Za-z][A-Za-z0-9]*$', id_number):
+            if not _PASSPORT_RE.fullmatch(id_number):
                 return False, "Invalid passport number format"
             
             return True, "Valid passport number"
@@ -445,7 +750,7 @@ class ValidationUtils:
             return False, "Phone number is required"
         
         # Remove all non-digit characters except +
-        phone_clean = re.sub(r'[^\d+]', '', phone)
+        phone_clean = _PHONE_STRIP_RE.sub('', phone)
         
         # Check Egyptian phone numbers
         if phone_clean.startswith('+20'):
@@ -477,9 +782,7 @@ class ValidationUtils:
             return False, "Email is required"
         
         # Basic email pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if re.match(pattern, email):
+        if _EMAIL_RE.fullmatch(email):
             return True, "Valid email address"
         
         return False, "Invalid email format"
@@ -500,8 +803,30 @@ class ValidationUtils:
         
         return country_code.isalpha() and country_code.isupper()
 
+# ==================== MATCH RESULTS ====================
+
+class MatchResult(NamedTuple):
+    """Outcome of comparing a customer with one sanctions entry"""
+    is_match: bool
+    sanction_id: int
+    sanction_name: Optional[str]
+    sanction_source: Optional[str]
+    match_type: str  # EXACT, PARTIAL or NO_MATCH
+    match_score: float
+    name_match_score: float
+    dob_match: bool
+    nationality_match: bool
+    risk_level: str
+
 # ==================== RISK CALCULATOR ====================
 
+# Lower score bound of each risk level above VERY_LOW, ascending
+_RISK_LEVEL_THRESHOLDS = (20, 40, 60, 80)
+_RISK_LEVELS = ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+_AGE_RISK_PENALTY = 15
+_ZERO_ID_PENALTY = 20
+
 class RiskCalculator:
     """Calculate risk scores for customers"""
     
@@ -513,9 +838,10 @@ class RiskCalculator:
             config_module: Configuration module
         """
         self.config = config_module
+        self._country_penalty_table = None  # Built on first batch lookup
     
     def calculate_customer_risk(self, customer_data: Dict[str, Any], 
-                               sanction_matches: List[Dict]) -> Dict[str, Any]:
+                               sanction_matches: List[MatchResult]) -> Dict[str, Any]:
         """
         Calculate comprehensive risk score for a customer
         
@@ -531,8 +857,8 @@ class RiskCalculator:
         risk_details = {}
         
         # 1. PEP Check
-        occupation = customer_data.get('occupation', '').lower()
-        if StringUtils.contains_pep_indicator(occupation, self.config.PEP_INDICATORS):
+        occupation = (customer_data.get('occupation') or '').lower()
+        if occupation and self.config.PEP_MATCHER(occupation):
             pep_penalty = self.config.RISK_SCORING['pep_penalty']
             risk_score += pep_penalty
             risk_factors.append("PEP - Politically Exposed Person")
@@ -541,8 +867,9 @@ class RiskCalculator:
         
         # 2. High-risk Country Check
         nationality = customer_data.get('nationality_code', '')
-        if nationality in self.config.HIGH_RISK_COUNTRIES:
-            country_penalty = self.config.RISK_SCORING['high_risk_country_penalty']
+        tier = self.config.COUNTRY_RISK_TIER.get(nationality, 0)
+        country_penalty = self.config.COUNTRY_TIER_PENALTY[tier]
+        if country_penalty:
             risk_score += country_penalty
             risk_factors.append(f"High-risk country: {nationality}")
             risk_details['high_risk_country'] = True
@@ -551,15 +878,15 @@ class RiskCalculator:
         # 3. Sanction Matches
         if sanction_matches:
             for match in sanction_matches:
-                if match.get('match_type') == 'EXACT':
-                    penalty = self.config.RISK_SCORING['sanction_match_penalty']
+                if match.match_type == 'EXACT':
+                    penalty = self.config.SANCTION_MATCH_PENALTY
                     risk_score += penalty
-                    risk_factors.append(f"Exact sanction match: {match.get('sanction_name', 'Unknown')}")
+                    risk_factors.append(f"Exact sanction match: {match.sanction_name or 'Unknown'}")
                     risk_details['exact_matches'] = risk_details.get('exact_matches', 0) + 1
                 else:
-                    penalty = self.config.RISK_SCORING['partial_match_penalty']
+                    penalty = self.config.PARTIAL_MATCH_PENALTY
                     risk_score += penalty
-                    risk_factors.append(f"Partial sanction match: {match.get('sanction_name', 'Unknown')}")
+                    risk_factors.append(f"Partial sanction match: {match.sanction_name or 'Unknown'}")
                     risk_details['partial_matches'] = risk_details.get('partial_matches', 0) + 1
         
         # 4. Age-based Risk
@@ -567,7 +894,7 @@ class RiskCalculator:
         if dob:
             age = DateUtils.calculate_age(dob)
             if age and age > self.config.RISK_SCORING['age_risk_threshold']:
-                risk_score += 15
+                risk_score += _AGE_RISK_PENALTY
                 risk_factors.append(f"High age risk: {age} years")
                 risk_details['age_risk'] = True
         
@@ -582,8 +909,8 @@ class RiskCalculator:
                 risk_details['suspicious_id'] = True
             
             # Check if ID is all zeros or sequential
-            if id_number == '0' * len(id_number):
-                risk_score += 20
+            if not id_number.strip('0'):
+                risk_score += _ZERO_ID_PENALTY
                 risk_factors.append("ID number contains only zeros")
         
         # 6. Additional Risk Factors
@@ -592,8 +919,7 @@ class RiskCalculator:
         # - Recent changes in customer data
         
         # Cap risk score at maximum
-        max_score = self.config.RISK_SCORING['max_risk_score']
-        risk_score = min(risk_score, max_score)
+        risk_score = min(risk_score, self.config.MAX_RISK_SCORE)
         
         # Determine risk level
         risk_level = self._determine_risk_level(risk_score)
@@ -616,16 +942,75 @@ class RiskCalculator:
         Returns:
             str: Risk level category
         """
-        if risk_score >= 80:
-            return 'CRITICAL'
-        elif risk_score >= 60:
-            return 'HIGH'
-        elif risk_score >= 40:
-            return 'MEDIUM'
-        elif risk_score >= 20:
-            return 'LOW'
-        else:
-            return 'VERY_LOW'
+        return _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, risk_score)]
+    
+    def country_penalties_batch(self, nationality_codes: Iterable[str]) -> Any:
+        """
+        Look up the nationality penalty for many customers at once
+        
+        Two-letter codes index a 26x26 table of penalties, so the whole
+        batch is one NumPy gather instead of a dict lookup per customer.
+        Like calculate_customer_risk, matching is case-sensitive and
+        unlisted or malformed codes get no penalty.
+        
+        Args:
+            nationality_codes (iterable): ISO country codes, one per customer
+        
+        Returns:
+            np.ndarray: Country penalties, suitable for score_batch
+        """
+        import numpy as np
+        
+        table = self._country_penalty_table
+        if table is None:
+            table = np.zeros(26 * 26, dtype=np.int64)
+            penalties = self.config.COUNTRY_TIER_PENALTY
+            for code, tier in self.config.COUNTRY_RISK_TIER.items():
+                table[(ord(code[0]) - 65) * 26 + ord(code[1]) - 65] = penalties[tier]
+            self._country_penalty_table = table
+        
+        codes = np.array([code if isinstance(code, str) and len(code) == 2 and code.isascii() else ''
+                          for code in nationality_codes], dtype='S2')
+        letters = codes.view(np.uint8).reshape(-1, 2).astype(np.int64) - 65
+        valid = ((letters >= 0) & (letters < 26)).all(axis=1)
+        index = np.where(valid, letters[:, 0] * 26 + letters[:, 1], 0)
+        return np.where(valid, table[index], 0)
+    
+    def score_batch(self, pep_flags, country_penalties, exact_counts, partial_counts,
+                    age_flags, suspicious_id_flags, zero_id_flags) -> Tuple[Any, Any]:
+        """
+        Score many customers at once from precomputed risk features
+        
+        Applies the same penalties, cap and level bands as
+        calculate_customer_risk, as whole-array NumPy operations. Each
+        argument holds one entry per customer, in the same order.
+        
+        Args:
+            pep_flags (array-like): Occupation matched a PEP indicator
+            country_penalties (array-like): Nationality penalty (see COUNTRY_TIER_PENALTY)
+            exact_counts (array-like): Number of exact sanction matches
+            partial_counts (array-like): Number of partial sanction matches
+            age_flags (array-like): Age is above the age risk threshold
+            suspicious_id_flags (array-like): ID number uses 3 or fewer distinct characters
+            zero_id_flags (array-like): ID number is all zeros
+        
+        Returns:
+            tuple: (risk scores as an int array, risk levels as a str array)
+        """
+        import numpy as np
+        
+        scoring = self.config.RISK_SCORING
+        scores = (np.asarray(pep_flags, dtype=np.int64) * scoring['pep_penalty']
+                  + np.asarray(country_penalties, dtype=np.int64)
+                  + np.asarray(exact_counts, dtype=np.int64) * self.config.SANCTION_MATCH_PENALTY
+                  + np.asarray(partial_counts, dtype=np.int64) * self.config.PARTIAL_MATCH_PENALTY
+                  + np.asarray(age_flags, dtype=np.int64) * _AGE_RISK_PENALTY
+                  + np.asarray(suspicious_id_flags, dtype=np.int64) * scoring['unusual_id_penalty']
+                  + np.asarray(zero_id_flags, dtype=np.int64) * _ZERO_ID_PENALTY)
+        np.minimum(scores, self.config.MAX_RISK_SCORE, out=scores)
+        
+        bands = np.searchsorted(_RISK_LEVEL_THRESHOLDS, scores, side='right')
+        return scores, np.array(_RISK_LEVELS)[bands]
 
 # ==================== REPORT GENERATOR ====================
 
@@ -634,7 +1019,7 @@ class ReportGenerator:
     
     @staticmethod
     def generate_screening_report(screening_data: Dict, customer_data: Dict, 
-                                 matches: List[Dict]) -> Dict[str, Any]:
+                                 matches: List[MatchResult]) -> Dict[str, Any]:
         """
         Generate comprehensive screening report
         
@@ -646,11 +1031,13 @@ class ReportGenerator:
         Returns:
             dict: Complete screening report
         """
-        report_id = f"SCR-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        now = datetime.now()
+        report_id = f"SCR-{now.strftime('%Y%m%d-%H%M%S')}"
+        buckets = ReportGenerator._bucket_matches(matches)
         
         report = {
             'report_id': report_id,
-            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'generation_date': now.strftime('%Y-%m-%d %H:%M:%S'),
             'report_type': 'KYC_SCREENING_REPORT',
             'version': '1.0',
             
@@ -668,21 +1055,21 @@ class ReportGenerator:
                 'screening_date': screening_data.get('screening_date'),
                 'screening_type': screening_data.get('screening_type'),
                 'total_matches': len(matches),
-                'exact_matches': sum(1 for m in matches if m.get('match_type') == 'EXACT'),
-                'partial_matches': sum(1 for m in matches if m.get('match_type') == 'PARTIAL'),
+                'exact_matches': len(buckets.get('EXACT', ())),
+                'partial_matches': len(buckets.get('PARTIAL', ())),
                 'risk_score': screening_data.get('risk_score'),
                 'risk_level': screening_data.get('risk_level'),
                 'screening_result': screening_data.get('screening_result'),
             },
             
-            'matches_details': matches,
+            'matches_details': [m._asdict() for m in matches],
             
             'risk_assessment': {
                 'risk_factors': screening_data.get('risk_factors', []),
                 'risk_details': screening_data.get('risk_details', {}),
             },
             
-            'recommendations': ReportGenerator._generate_recommendations(screening_data, matches),
+            'recommendations': ReportGenerator._generate_recommendations(screening_data, buckets),
             
             'disclaimer': "This report is generated automatically for compliance screening purposes. " \
                          "Final decisions should be made by authorized personnel.",
@@ -691,13 +1078,30 @@ class ReportGenerator:
         return report
     
     @staticmethod
-    def _generate_recommendations(screening_data: Dict, matches: List[Dict]) -> List[str]:
+    def _bucket_matches(matches: List[MatchResult]) -> Dict[str, List[MatchResult]]:
+        """
+        Group matches by match type in a single pass
+        
+        Args:
+            matches (list): List of sanction matches
+        
+        Returns:
+            dict: Match type -> matches of that type, in their original order
+        """
+        buckets = {}
+        for match in matches:
+            buckets.setdefault(match.match_type, []).append(match)
+        return buckets
+    
+    @staticmethod
+    def _generate_recommendations(screening_data: Dict,
+                                  buckets: Dict[str, List[MatchResult]]) -> List[str]:
         """
         Generate recommendations based on screening results
         
         Args:
             screening_data (dict): Screening results
-            matches (list): List of sanction matches
+            buckets (dict): Sanction matches grouped by type (see _bucket_matches)
         
         Returns:
             list: List of recommendations
@@ -705,19 +1109,18 @@ class ReportGenerator:
         recommendations = []
         risk_level = screening_data.get('risk_level', 'LOW')
         
-        if not matches:
+        if not buckets:
             recommendations.append("✅ No sanctions matches found - Proceed with standard onboarding")
         else:
             recommendations.append("🚨 Sanctions matches detected - Immediate review required")
             
-            exact_matches = [m for m in matches if m.get('match_type') == 'EXACT']
+            exact_matches = buckets.get('EXACT')
             if exact_matches:
                 recommendations.append("⛔ REJECT customer - Exact matches with sanctioned entities")
                 for match in exact_matches[:3]:  # Show top 3 matches
-                    recommendations.append(f"   - {match.get('sanction_name')} ({match.get('sanction_source')})")
+                    recommendations.append(f"   - {match.sanction_name} ({match.sanction_source})")
             
-            partial_matches = [m for m in matches if m.get('match_type') == 'PARTIAL']
-            if partial_matches:
+            if buckets.get('PARTIAL'):
                 recommendations.append("⚠️ Enhanced Due Diligence required - Partial matches found")
         
         # Additional recommendations based on risk level
@@ -812,14 +1215,43 @@ def format_currency(amount: float, currency: str = 'USD') -> str:
     """Format currency amount"""
     return f"{amount:,.2f} {currency}"
 
+_ORJSON_DUMPS_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                         if orjson is not None else 0)
+
 def safe_json_dumps(data: Any) -> str:
-    """Safely convert data to JSON string"""
+    """Safely convert data to JSON string (via orjson when installed)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_DUMPS_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: let the json module try
     try:
         return json.dumps(data, ensure_ascii=False, indent=2)
     except Exception as e:
         logger.error(f"Error converting to JSON: {e}")
         return str(data)
 
+def write_json_file(data: Any, output_file: str) -> None:
+    """
+    Write data to a file as indented UTF-8 JSON (via orjson when installed)
+    
+    Args:
+        data: JSON-serialisable data
+        output_file (str): Output file path
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=_ORJSON_DUMPS_OPTIONS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: let the json module try
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(encoded)
+            return
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 def mask_sensitive_data(text: str, visible_chars: int = 4) -> str:
     """Mask sensitive data for logging"""
     if not text or len(text) <= visible_chars: